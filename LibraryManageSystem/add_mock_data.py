@@ -9,7 +9,12 @@ This script adds realistic sample data to the library database including:
 - Historical and current borrowing activities
 """
 
-from app import app, db, Book, BorrowRecord
+from app_swagger import app
+from models import db
+from models.book import Book
+from models.borrow import BorrowRecord
+from services.book_service import BookService
+from sqlalchemy import insert
 from datetime import datetime, timedelta
 import random
 
@@ -141,16 +146,14 @@ def add_mock_books():
         }
     ]
     
-    books = []
-    for book_data in books_data:
-        # Check if book already exists (avoid duplicates on reruns)
-        existing_book = Book.query.filter_by(isbn=book_data['isbn']).first()
-        if not existing_book:
-            book = Book(**book_data)
-            books.append(book)
-            db.session.add(book)
+    # Skip books that already exist (avoid duplicates on reruns), looked up
+    # with one query instead of one per book
+    isbns = [book_data['isbn'] for book_data in books_data]
+    existing_isbns = {isbn for (isbn,) in db.session.query(Book.isbn).filter(Book.isbn.in_(isbns))}
+    books = [book_data for book_data in books_data if book_data['isbn'] not in existing_isbns]
     
-    db.session.commit()
+    # One INSERT and one commit for the whole batch
+    BookService.bulk_create_books(books)
     print(f"Added {len(books)} books to the library")
     return books
 
@@ -188,16 +191,14 @@ def add_mock_borrow_records():
             loan_period = random.randint(14, 21)
             due_date = borrow_date + timedelta(days=loan_period)
             
-            record = BorrowRecord(
-                book_id=book.id,
-                borrower_name=borrower_name,
-                borrower_email=borrower_email,
-                borrow_date=borrow_date,
-                due_date=due_date,
-                returned=False
-            )
-            records.append(record)
-            db.session.add(record)
+            records.append({
+                'book_id': book.id,
+                'borrower_name': borrower_name,
+                'borrower_email': borrower_email,
+                'borrow_date': borrow_date,
+                'due_date': due_date,
+                'returned': False
+            })
     
     # Add some historical records (returned books)
     available_books = Book.query.filter_by(available=True).all()
@@ -219,19 +220,20 @@ def add_mock_borrow_records():
         return_variation = random.randint(-3, 7)  # -3 days early to 7 days late
         return_date = due_date + timedelta(days=return_variation)
         
-        record = BorrowRecord(
-            book_id=book.id,
-            borrower_name=borrower_name,
-            borrower_email=borrower_email,
-            borrow_date=borrow_date,
-            due_date=due_date,
-            return_date=return_date,
-            returned=True
-        )
-        records.append(record)
-        db.session.add(record)
+        records.append({
+            'book_id': book.id,
+            'borrower_name': borrower_name,
+            'borrower_email': borrower_email,
+            'borrow_date': borrow_date,
+            'due_date': due_date,
+            'return_date': return_date,
+            'returned': True
+        })
     
-    db.session.commit()
+    # One INSERT and one commit for all records
+    if records:
+        db.session.execute(insert(BorrowRecord), records)
+        db.session.commit()
     print(f"Added {len(records)} borrowing records")
     return records
 
@@ -269,7 +271,7 @@ def main():
         print(f"Total borrowing records: {total_records}")
         print(f"Current active borrows: {current_borrows}")
         print("="*50)
-        print("\nYou can now start the Flask application with: python app.py")
+        print("\nYou can now start the Flask application with: python app_swagger.py")
         print("Visit http://127.0.0.1:5000 to see the library management system with mock data!")
 
 if __name__ == '__main__':
@@ -1,7 +1,11 @@
 import os
+import sqlite3
 from flask import Flask
 from flask_restx import Api
 from dotenv import load_dotenv
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from models import db
 
 # Import monitoring and rate limiting
@@ -11,6 +15,18 @@ from utils.request_logger_middleware import setup_request_logging
 
 load_dotenv()
 
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection (no-op for PostgreSQL)"""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    # WAL lets readers run while a write commits; NORMAL only fsyncs at checkpoints
+    cursor = dbapi_connection.cursor()
+    for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY",
+                   "cache_size=-64000", "mmap_size=268435456"):
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
 def create_app(config=None):
     """Application factory pattern with Swagger support"""
     app = Flask(__name__)
@@ -20,6 +36,9 @@ def create_app(config=None):
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///library.db')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['DEBUG'] = os.getenv('DEBUG', 'True').lower() == 'true'
+    # Create missing tables at startup; set INIT_DB=false once the schema
+    # exists and run `flask --app app_swagger init-db` on deploy instead
+    app.config['INIT_DB'] = os.getenv('INIT_DB', 'True').lower() == 'true'
     
     # Session configuration
     app.config['SESSION_TYPE'] = 'filesystem'
@@ -32,11 +51,23 @@ def create_app(config=None):
     if config:
         app.config.update(config)
     
+    # Fixed connection pool: connections (and their PRAGMAs) are reused across
+    # requests; pre-ping drops connections the database server has closed.
+    # In-memory SQLite uses a single static connection, so it is left alone.
+    if ':memory:' not in app.config['SQLALCHEMY_DATABASE_URI']:
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {
+            'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),
+            'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 20)),
+            'pool_recycle': 1800,
+            'pool_pre_ping': True
+        })
+    
     db.init_app(app)
     
 
     from models.book import Book
     from models.borrow import BorrowRecord
+    from models.data_version import DataVersion
     # Add health check endpoint
     @app.route('/health')
     def health_check():
@@ -90,12 +121,31 @@ def create_app(config=None):
         """Silent handler for Chrome DevTools probe - returns 204 No Content"""
         return '', 204
     
+    # Templates: only stat files for changes in debug mode, and otherwise
+    # compile every template once at startup rather than on first request.
+    # JINJA_CACHE_DIR keeps compiled templates across restarts.
+    app.config.setdefault('TEMPLATES_AUTO_RELOAD', app.config['DEBUG'])
+    jinja_cache_dir = os.getenv('JINJA_CACHE_DIR')
+    if jinja_cache_dir:
+        os.makedirs(jinja_cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
+    if not app.config['TEMPLATES_AUTO_RELOAD']:
+        for template_name in app.jinja_env.list_templates():
+            app.jinja_env.get_template(template_name)
+    
     # Register error handlers
     register_error_handlers(app, api)
     
     # Create database tables
-    with app.app_context():
+    @app.cli.command('init-db')
+    def init_db():
+        """Create all database tables."""
         db.create_all()
+        print("Database tables created")
+    
+    if app.config['INIT_DB']:
+        with app.app_context():
+            db.create_all()
     
     # Setup monitoring, rate limiting, and logging
     setup_monitoring(app)
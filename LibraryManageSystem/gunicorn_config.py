@@ -14,7 +14,10 @@ backlog = 2048
 cpu_count = multiprocessing.cpu_count()
 default_workers = min((2 * cpu_count) + 1, 8)  # Tối đa 8 workers cho PostgreSQL
 workers = int(os.getenv('WORKERS', default_workers))
-worker_class = os.getenv('WORKER_CLASS', 'sync')
+# Threaded workers: requests mostly wait on database I/O (which releases
+# the GIL), so each process serves several at once
+worker_class = os.getenv('WORKER_CLASS', 'gthread')
+threads = int(os.getenv('THREADS', '4'))
 worker_connections = 1000
 max_requests = 1000
 max_requests_jitter = 100
@@ -62,7 +65,7 @@ def on_reload(server):
 def when_ready(server):
     """Called just after the server is started."""
     print(f"✅ Gunicorn is ready. Listening on {bind}")
-    print(f"👷 Workers: {workers} (optimized for PostgreSQL)")
+    print(f"👷 Workers: {workers} x {threads} threads (optimized for PostgreSQL)")
     print(f"⏱️  Timeout: {timeout}s")
 
 def pre_fork(server, worker):
@@ -1,19 +1,60 @@
-from datetime import datetime
+import re
+from functools import cached_property, lru_cache
+from flask import current_app
+from sqlalchemy import DDL, event
+from sqlalchemy.orm import validates
 from . import db
 
+# Separators people type inside an ISBN (978-0-7432-7356-5, 978 0 7432 7356 5)
+_ISBN_SEPARATORS_RE = re.compile(r'[\s-]')
+
+
+@lru_cache(maxsize=4096)
+def normalize_isbn(isbn):
+    """Canonical ISBN: hyphens and spaces removed (978-0-7432-7356-5 -> 9780743273565)
+
+    Only separators are dropped; any other value is kept as given, not
+    validated, so identifiers that were accepted before still are.
+    """
+    return _ISBN_SEPARATORS_RE.sub('', isbn)
+
+
 class Book(db.Model):
+    # PostgreSQL: trigram GIN indexes let the '%term%' (I)LIKE searches on
+    # title/author use an index instead of a sequential scan
+    __table_args__ = (
+        db.Index('ix_book_title_trgm', 'title', postgresql_using='gin',
+                 postgresql_ops={'title': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        db.Index('ix_book_author_trgm', 'author', postgresql_using='gin',
+                 postgresql_ops={'author': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
+        # The book lists are ordered by created_at (newest first), so these
+        # return a page in index order with no sort step. Every availability
+        # filter is available = true, so the partial index holding only those
+        # rows also serves the available-only list, and stays small when
+        # most books are out.
+        db.Index('ix_book_created_at', 'created_at'),
+        db.Index('ix_book_available_created_at', 'created_at',
+                 sqlite_where=db.text('available = 1'),
+                 postgresql_where=db.text('available = true')),
+    )
+    # Fetch server-generated columns (created_at) via RETURNING on insert
+    __mapper_args__ = {'eager_defaults': True}
+    
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     author = db.Column(db.String(100), nullable=False)
     isbn = db.Column(db.String(13), unique=True, nullable=False)
     available = db.Column(db.Boolean, default=True, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=db.func.current_timestamp())
+    
+    borrow_records = db.relationship('BorrowRecord', back_populates='book', lazy='select')
     
     def __repr__(self):
         return f'<Book {self.title}>'
     
-    def to_dict(self):
-        """Convert Book object to dictionary for JSON serialization"""
+    @cached_property
+    def _as_dict(self):
+        """Serialized fields, built once per loaded state (see _drop_cached_dict)"""
         return {
             'id': self.id,
             'title': self.title,
@@ -23,6 +64,24 @@ class Book(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
     
+    def to_dict(self):
+        """Convert Book object to dictionary for JSON serialization"""
+        # A copy, so callers can't modify the cached dict
+        return dict(self._as_dict)
+    
+    @staticmethod
+    def row_to_dict(row):
+        """Same output as to_dict() for a column row from BookService.get_books_paginated"""
+        data = row._asdict()
+        created_at = data['created_at']
+        data['created_at'] = created_at.isoformat() if created_at else None
+        return data
+    
+    @validates('isbn')
+    def validate_isbn(self, key, isbn):
+        """Store every ISBN set on a Book (from_dict, updates) in canonical form"""
+        return normalize_isbn(isbn) if isbn else isbn
+    
     @staticmethod
     def from_dict(data):
         """Create Book object from dictionary"""
@@ -30,4 +89,95 @@ class Book(db.Model):
             title=data.get('title'),
             author=data.get('author'),
             isbn=data.get('isbn')
-        )
\ No newline at end of file
+        )
+
+
+@event.listens_for(Book, 'expire')
+@event.listens_for(Book, 'refresh')
+@event.listens_for(Book, 'refresh_flush')
+def _drop_cached_dict(target, *args):
+    """Forget the cached to_dict() fields whenever the loaded state changes"""
+    # expire can fire for an instance that has already been garbage collected
+    if target is not None:
+        target.__dict__.pop('_as_dict', None)
+
+
+@event.listens_for(Book, 'after_insert')
+def _drop_cached_dict_after_insert(mapper, connection, target):
+    # The primary key is assigned by the INSERT, not through a setter
+    _drop_cached_dict(target)
+
+
+for _column in ('id', 'title', 'author', 'isbn', 'available', 'created_at'):
+    event.listen(getattr(Book, _column), 'set', _drop_cached_dict)
+
+
+# The trigram indexes need the pg_trgm extension
+event.listen(Book.__table__, 'before_create',
+             DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect='postgresql'))
+
+
+# SQLite full-text index over title/author, kept in sync by triggers.
+# External content table: book_fts stores only the index, rows live in book.
+_BOOK_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS book_fts USING fts5("
+    "title, author, content='book', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS book_fts_ai AFTER INSERT ON book BEGIN "
+    "INSERT INTO book_fts(rowid, title, author) VALUES (new.id, new.title, new.author); END",
+    "CREATE TRIGGER IF NOT EXISTS book_fts_ad AFTER DELETE ON book BEGIN "
+    "INSERT INTO book_fts(book_fts, rowid, title, author) "
+    "VALUES ('delete', old.id, old.title, old.author); END",
+    "CREATE TRIGGER IF NOT EXISTS book_fts_au AFTER UPDATE OF title, author ON book BEGIN "
+    "INSERT INTO book_fts(book_fts, rowid, title, author) "
+    "VALUES ('delete', old.id, old.title, old.author); "
+    "INSERT INTO book_fts(rowid, title, author) VALUES (new.id, new.title, new.author); END",
+    # Index rows that existed before the FTS table (no-op cost on a fresh DB)
+    "INSERT INTO book_fts(book_fts) VALUES ('rebuild')",
+)
+
+
+@event.listens_for(db.metadata, 'after_create')
+def create_book_fts(target, connection, **kw):
+    """Create the FTS5 index the first time create_all sees a database without it
+
+    create_all runs on every worker boot (INIT_DB), so an existing index is
+    left alone instead of being rebuilt from the whole book table each time.
+    """
+    if connection.dialect.name != 'sqlite':
+        return
+    if connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'book_fts'"
+    ).first():
+        return
+    for statement in _BOOK_FTS_DDL:
+        connection.exec_driver_sql(statement)
+
+
+def has_book_fts():
+    """Whether the current SQLite database has the book_fts index yet
+
+    Only create_all builds it, so a database opened with INIT_DB=false may
+    not have it until `flask init-db` runs; searches fall back to LIKE until
+    then. A positive answer is remembered on the app.
+    """
+    if current_app.extensions.get('book_fts'):
+        return True
+    found = db.session.execute(db.text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'book_fts'"
+    )).first() is not None
+    current_app.extensions['book_fts'] = found
+    return found
+
+
+def book_fts_match(text):
+    """SQLite filter: books where every word of text starts a word of the
+    title or author (book_fts MATCH), e.g. 'clean mar' finds 'Clean Code' by
+    Robert C. Martin, but 'ode' does not match 'Code'"""
+    # Quote each word so FTS5 operators in user input are taken literally,
+    # and make it a prefix match
+    terms = ' '.join('"{}"*'.format(word.replace('"', '""')) for word in text.split())
+    return Book.id.in_(
+        db.select(db.column('rowid')).select_from(db.table('book_fts'))
+        .where(db.text('book_fts MATCH :terms').bindparams(terms=terms))
+    )
@@ -1,23 +1,48 @@
 from datetime import datetime, timedelta
+from flask import g, has_request_context
 from . import db
 
+def request_now():
+    """Current UTC time, read once per request (g.now) so every record in a
+    response is judged against the same instant; a fresh reading elsewhere"""
+    if not has_request_context():
+        return datetime.utcnow()
+    if 'now' not in g:
+        g.now = datetime.utcnow()
+    return g.now
+
 class BorrowRecord(db.Model):
+    # Active/overdue lookups filter on returned (and due_date), so one
+    # composite index serves both; book_id is indexed for the join to Book
+    __table_args__ = (
+        db.Index('ix_borrow_record_returned_due_date', 'returned', 'due_date'),
+    )
+    # Fetch server-generated columns (borrow_date) via RETURNING on insert
+    __mapper_args__ = {'eager_defaults': True}
+    
     id = db.Column(db.Integer, primary_key=True)
-    book_id = db.Column(db.Integer, db.ForeignKey('book.id'), nullable=False)
+    book_id = db.Column(db.Integer, db.ForeignKey('book.id'), nullable=False, index=True)
     borrower_name = db.Column(db.String(100), nullable=False)
     borrower_email = db.Column(db.String(100), nullable=False)
-    borrow_date = db.Column(db.DateTime, default=datetime.utcnow)
+    borrow_date = db.Column(db.DateTime, server_default=db.func.current_timestamp())
     due_date = db.Column(db.DateTime, nullable=False)
     return_date = db.Column(db.DateTime)
     returned = db.Column(db.Boolean, default=False, nullable=False)
     
-    book = db.relationship('Book', backref=db.backref('borrow_records', lazy=True))
+    # Every view of a record shows its book, so load it in the same SELECT
+    # (inner join: book_id is NOT NULL) instead of one lazy SELECT per record
+    book = db.relationship('Book', back_populates='borrow_records', lazy='joined', innerjoin=True)
     
     def __repr__(self):
-        return f'<BorrowRecord {self.borrower_name} - {self.book.title}>'
+        # Local columns only: going through self.book could issue a query
+        return f'<BorrowRecord id={self.id} book_id={self.book_id} {self.borrower_name}>'
     
-    def to_dict(self):
-        """Convert BorrowRecord object to dictionary for JSON serialization"""
+    def to_dict(self, is_overdue=None):
+        """Convert BorrowRecord object to dictionary for JSON serialization
+
+        is_overdue: flag already computed by the query (see overdue_clause);
+        when omitted it is computed from the current time
+        """
         return {
             'id': self.id,
             'book_id': self.book_id,
@@ -28,19 +53,35 @@ class BorrowRecord(db.Model):
             'due_date': self.due_date.isoformat() if self.due_date else None,
             'return_date': self.return_date.isoformat() if self.return_date else None,
             'returned': self.returned,
-            'is_overdue': self.is_overdue()
+            'is_overdue': self.is_overdue() if is_overdue is None else is_overdue
         }
     
-    def is_overdue(self):
-        """Check if the book is overdue"""
+    def is_overdue(self, now=None):
+        """Check if the book is overdue (at now, default request_now())"""
         if self.returned:
             return False
-        return datetime.utcnow() > self.due_date
+        return (now or request_now()) > self.due_date
+    
+    @staticmethod
+    def overdue_clause(now):
+        """SQL form of is_overdue() at the given time, for list queries"""
+        return (BorrowRecord.returned == False) & (BorrowRecord.due_date < now)
+    
+    @staticmethod
+    def next_due_date(now):
+        """Earliest due_date of an unreturned record that is not overdue yet at now.
+
+        Overdue flags flip when the clock passes this instant, with no write
+        to the table, so cached views of borrow records go stale then.
+        """
+        return db.session.query(db.func.min(BorrowRecord.due_date)).filter(
+            BorrowRecord.returned == False, BorrowRecord.due_date >= now
+        ).scalar()
     
     @staticmethod
     def from_dict(data):
         """Create BorrowRecord object from dictionary"""
-        due_date = datetime.utcnow() + timedelta(days=data.get('days', 14))
+        due_date = request_now() + timedelta(days=data.get('days', 14))
         return BorrowRecord(
             book_id=data.get('book_id'),
             borrower_name=data.get('borrower_name'),
@@ -0,0 +1,83 @@
+from itertools import chain
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+from . import db
+
+# Tables whose changes invalidate cached GET responses
+VERSIONED_TABLES = ('book', 'borrow_record')
+
+class DataVersion(db.Model):
+    """Change counter per table, bumped in the same transaction as every write.
+
+    Read-only endpoints build their ETag from these counters, so a client's
+    cached copy stays valid until one of the tables behind it changes.
+    """
+    __tablename__ = 'data_version'
+
+    table_name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<DataVersion {self.table_name}={self.version}>'
+
+    @staticmethod
+    def current(table_names):
+        """Get the current counters for the given tables, in order"""
+        versions = dict(
+            db.session.query(DataVersion.table_name, DataVersion.version)
+            .filter(DataVersion.table_name.in_(table_names))
+        )
+        return [versions.get(name, 0) for name in table_names]
+
+@event.listens_for(DataVersion.__table__, 'after_create')
+def seed_versions(target, connection, **kw):
+    """Start every versioned table at 0 so bumps are a plain UPDATE"""
+    connection.execute(target.insert(), [
+        {'table_name': name, 'version': 0} for name in VERSIONED_TABLES
+    ])
+
+def _changed_tables(session):
+    return session.info.setdefault('changed_tables', set())
+
+@event.listens_for(Session, 'after_flush')
+def track_flushed_tables(session, flush_context):
+    """Record tables written through the unit of work (add/modify/delete)
+
+    session.dirty also holds objects whose attributes were only touched, or
+    whose collections changed; those issue no UPDATE, so they are skipped
+    rather than bumping (and locking) their table's counter row.
+    """
+    dirty = (obj for obj in session.dirty
+             if session.is_modified(obj, include_collections=False))
+    for obj in chain(session.new, dirty, session.deleted):
+        name = obj.__table__.name
+        if name in VERSIONED_TABLES:
+            _changed_tables(session).add(name)
+
+@event.listens_for(Session, 'do_orm_execute')
+def track_statement_writes(orm_execute_state):
+    """Record tables written by insert()/update()/delete() statements"""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        name = orm_execute_state.statement.table.name
+        if name in VERSIONED_TABLES:
+            _changed_tables(orm_execute_state.session).add(name)
+
+@event.listens_for(Session, 'before_commit')
+def bump_versions(session):
+    """Bump the counters of every table this transaction wrote, in one UPDATE
+
+    Every writer updates these rows, so they are touched as late as possible
+    (right before COMMIT) and only for tables that really changed.
+    """
+    session.flush()
+    changed = session.info.pop('changed_tables', None)
+    if changed:
+        session.execute(
+            update(DataVersion)
+            .where(DataVersion.table_name.in_(changed))
+            .values(version=DataVersion.version + 1)
+        )
+
+@event.listens_for(Session, 'after_rollback')
+def forget_changes(session):
+    session.info.pop('changed_tables', None)
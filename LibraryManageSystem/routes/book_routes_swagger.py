@@ -1,8 +1,10 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
 from services.book_service import BookService
+from models.book import Book as BookModel
 from utils.response_helpers import success_response, error_response, handle_service_error
 from utils.rate_limiter import limiter, PUBLIC_READ_LIMITS, WRITE_LIMITS
+from utils.http_cache import conditional_get
 
 # Create namespace for books API
 book_ns = Namespace('books', description='Book management operations')
@@ -37,11 +39,12 @@ error_response_model = book_ns.model('ErrorResponse', {
 
 @book_ns.route('')
 class BookList(Resource):
+    @conditional_get('book')
     @book_ns.doc('get_books')
     @book_ns.marshal_with(success_response_model)
     @book_ns.param('page', 'Page number (default: 1)', type='integer', default=1)
     @book_ns.param('per_page', 'Items per page (5, 10, 15)', type='integer', default=10, enum=[5, 10, 15])
-    @book_ns.param('search', 'Search query for title or author', type='string', required=False)
+    @book_ns.param('search', 'Words to find in title or author (word-prefix match)', type='string', required=False)
     @book_ns.param('available_only', 'Show only available books', type='boolean', default=False)
 
     def get(self):
@@ -56,21 +59,15 @@ class BookList(Resource):
             search = request.args.get('search', '').strip()
             available_only = request.args.get('available_only', 'false').lower() == 'true'
             
-            # Prepare simplified search parameters
-            search_params = {
-                'search': search,
-                'available_only': available_only
-            }
-            
-            # Perform search with pagination
-            result = BookService.search_and_paginate_books(search_params, page, per_page)
+            # Perform search with pagination (column rows, no Book instances)
+            result = BookService.get_books_paginated(page, per_page, search, available_only)
             
             # Build pagination info
             pagination_info = PaginationHelper.build_pagination_response(result, 'books_book_list')
             
             # Prepare response data
             response_data = {
-                'books': [book.to_dict() for book in result['items']],
+                'books': [BookModel.row_to_dict(row) for row in result['items']],
                 'pagination': pagination_info,
                 'filters': {
                     'search': search or None,
@@ -116,11 +113,12 @@ class BookList(Resource):
 
 @book_ns.route('/available')
 class AvailableBooks(Resource):
+    @conditional_get('book')
     @book_ns.doc('get_available_books')
     @book_ns.marshal_with(success_response_model)
     @book_ns.param('page', 'Page number (default: 1)', type='integer', default=1)
     @book_ns.param('per_page', 'Items per page (5, 10, 15)', type='integer', default=10, enum=[5, 10, 15])
-    @book_ns.param('search', 'Search query for title or author', type='string', required=False)
+    @book_ns.param('search', 'Words to find in title or author (word-prefix match)', type='string', required=False)
     def get(self):
         """Get all available books with search and pagination"""
         try:
@@ -132,21 +130,15 @@ class AvailableBooks(Resource):
             # Get search parameters (simplified) and force available_only to True
             search = request.args.get('search', '').strip()
             
-            # Prepare simplified search parameters
-            search_params = {
-                'search': search,
-                'available_only': True  # Force available only
-            }
-            
-            # Perform search with pagination
-            result = BookService.search_and_paginate_books(search_params, page, per_page)
+            # Perform search with pagination (column rows, no Book instances)
+            result = BookService.get_books_paginated(page, per_page, search, available_only=True)
             
             # Build pagination info
             pagination_info = PaginationHelper.build_pagination_response(result, 'books_available_books')
             
             # Prepare response data
             response_data = {
-                'books': [book.to_dict() for book in result['items']],
+                'books': [BookModel.row_to_dict(row) for row in result['items']],
                 'pagination': pagination_info,
                 'filters': {
                     'search': search or None,
@@ -164,6 +156,7 @@ class AvailableBooks(Resource):
 
 @book_ns.route('/<int:book_id>')
 class Book(Resource):
+    @conditional_get('book')
     @book_ns.doc('get_book')
     @book_ns.marshal_with(success_response_model)
     @book_ns.response(404, 'Book not found', error_response_model)
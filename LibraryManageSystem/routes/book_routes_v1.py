@@ -34,12 +34,12 @@ class BookListV1(Resource):
         """Get all books (v1 - no search, no pagination)"""
         try:
             # Get all books without any filtering
-            books = BookService.get_all_books()
+            books = BookService.get_book_dicts()
             
             return success_response(
                 data={
                     'version': '1.0',
-                    'books': [book.to_dict() for book in books],
+                    'books': books,
                     'total': len(books)
                 },
                 message=f"Retrieved {len(books)} books"
@@ -2,6 +2,7 @@ from flask import request
 from flask_restx import Namespace, Resource, fields
 from services.borrow_service import BorrowService
 from utils.response_helpers import success_response, error_response
+from utils.http_cache import conditional_get
 
 # Create namespace for borrows API
 borrow_ns = Namespace('borrows', description='Book borrowing operations')
@@ -53,6 +54,7 @@ error_response_model = borrow_ns.model('ErrorResponse', {
 
 @borrow_ns.route('')
 class BorrowList(Resource):
+    @conditional_get('borrow_record', 'book')
     @borrow_ns.doc('get_borrow_records')
     @borrow_ns.marshal_with(success_response_model)
     @borrow_ns.param('page', 'Page number (default: 1)', type='integer', default=1)
@@ -91,7 +93,7 @@ class BorrowList(Resource):
             
             # Prepare response data
             response_data = {
-                'borrows': [record.to_dict() for record in result['items']],
+                'borrows': [record.to_dict(is_overdue=is_overdue) for record, is_overdue in result['items']],
                 'pagination': pagination_info,
                 'filters': {
                     'search': search or None,
@@ -137,6 +139,7 @@ class BorrowList(Resource):
 
 @borrow_ns.route('/<int:record_id>')
 class BorrowRecord(Resource):
+    @conditional_get('borrow_record', 'book')
     @borrow_ns.doc('get_borrow_record')
     @borrow_ns.marshal_with(success_response_model)
     @borrow_ns.response(404, 'Borrow record not found', error_response_model)
@@ -200,6 +203,7 @@ class ExtendDueDate(Resource):
 
 @borrow_ns.route('/overdue')
 class OverdueBooks(Resource):
+    @conditional_get('borrow_record', 'book')
     @borrow_ns.doc('get_overdue_books')
     @borrow_ns.marshal_with(success_response_model)
     def get(self):
@@ -207,7 +211,7 @@ class OverdueBooks(Resource):
         try:
             records = BorrowService.get_overdue_borrows()
             return success_response(
-                data=[record.to_dict() for record in records],
+                data=[record.to_dict(is_overdue=True) for record in records],
                 message=f"Found {len(records)} overdue books"
             )
         except Exception as e:
@@ -1,17 +1,27 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session
-from datetime import datetime
 from services.book_service import BookService
 from services.borrow_service import BorrowService
 from services.auth_service import AuthService
 from utils.auth_middleware import login_required
+from utils.http_cache import conditional_get
 
 web_bp = Blueprint('web', __name__)
 
+# Fields posted by the add/edit book forms
+BOOK_FORM_FIELDS = ('title', 'author', 'isbn')
+
+def _book_form_data():
+    """Read the book form fields (a missing one is a 400, as request.form[...])"""
+    form = request.form
+    return {field: form[field] for field in BOOK_FORM_FIELDS}
+
 @web_bp.route('/')
 @login_required
 def index():
-    books = BookService.get_all_books()
-    return render_template('index.html', books=books)
+    # Counts and the latest few books only, not the whole table
+    return render_template('index.html',
+                         stats=BookService.get_book_counts(),
+                         books=BookService.get_recent_books(5))
 
 @web_bp.route('/login', methods=['GET', 'POST'])
 def login():
@@ -94,6 +104,7 @@ def logout():
 
 @web_bp.route('/books')
 @login_required
+@conditional_get('book', per_user=True)
 def books():
     # Get search and pagination parameters from request (simplified)
     search = request.args.get('search', '').strip()
@@ -126,11 +137,7 @@ def books():
 @login_required
 def add_book():
     if request.method == 'POST':
-        data = {
-            'title': request.form['title'],
-            'author': request.form['author'],
-            'isbn': request.form['isbn']
-        }
+        data = _book_form_data()
         
         try:
             BookService.create_book(data)
@@ -150,11 +157,7 @@ def edit_book(book_id):
         return redirect(url_for('web.books'))
     
     if request.method == 'POST':
-        data = {
-            'title': request.form['title'],
-            'author': request.form['author'],
-            'isbn': request.form['isbn']
-        }
+        data = _book_form_data()
         
         try:
             BookService.update_book(book_id, data)
@@ -179,15 +182,6 @@ def delete_book(book_id):
 @web_bp.route('/borrow_book/<int:book_id>', methods=['GET', 'POST'])
 @login_required
 def borrow_book(book_id):
-    book = BookService.get_book_by_id(book_id)
-    if not book:
-        flash('Book not found!', 'error')
-        return redirect(url_for('web.books'))
-    
-    if not book.available:
-        flash('This book is not available for borrowing!', 'error')
-        return redirect(url_for('web.books'))
-    
     if request.method == 'POST':
         data = {
             'book_id': book_id,
@@ -196,17 +190,30 @@ def borrow_book(book_id):
             'days': int(request.form.get('days', 14))
         }
         
+        # No lookup first: the service claims the book with one conditional
+        # UPDATE and raises ValueError if it is missing or already borrowed
         try:
             record = BorrowService.borrow_book(data)
             flash(f'Book borrowed successfully! Due date: {record.due_date.strftime("%Y-%m-%d")}', 'success')
             return redirect(url_for('web.borrowed_books'))
         except ValueError as e:
             flash(str(e), 'error')
+            return redirect(url_for('web.books'))
+    
+    book = BookService.get_book_by_id(book_id)
+    if not book:
+        flash('Book not found!', 'error')
+        return redirect(url_for('web.books'))
+    
+    if not book.available:
+        flash('This book is not available for borrowing!', 'error')
+        return redirect(url_for('web.books'))
     
     return render_template('borrow_book.html', book=book)
 
 @web_bp.route('/borrowed_books')
 @login_required
+@conditional_get('borrow_record', 'book', per_user=True)
 def borrowed_books():
     # Get search and pagination parameters from request (simplified)
     search = request.args.get('search', '').strip()
@@ -218,25 +225,18 @@ def borrowed_books():
     if per_page not in [5, 10, 15]:
         per_page = 10
     
-    # Check if BorrowService has paginated method, otherwise use the basic method
-    try:
-        result = BorrowService.get_borrows_paginated(
-            page=page,
-            per_page=per_page,
-            search=search,
-            status=status
-        )
-        return render_template('borrowed_books.html', 
-                             records=result['items'],  # Use 'items' from pagination result
-                             pagination=result,        # Pass the entire result as pagination
-                             search=search,
-                             status=status,
-                             per_page=per_page,
-                             today=datetime.utcnow())
-    except (AttributeError, KeyError):
-        # Fallback to basic method if paginated method doesn't exist
-        records = BorrowService.get_active_borrows()
-        return render_template('borrowed_books.html', records=records, today=datetime.utcnow())
+    result = BorrowService.get_borrows_paginated(
+        page=page,
+        per_page=per_page,
+        search=search,
+        status=status
+    )
+    return render_template('borrowed_books.html', 
+                         records=result['items'],  # Use 'items' from pagination result
+                         pagination=result,        # Pass the entire result as pagination
+                         search=search,
+                         status=status,
+                         per_page=per_page)
 
 @web_bp.route('/return_book/<int:record_id>')
 @login_required
@@ -251,6 +251,7 @@ def return_book(record_id):
 
 @web_bp.route('/history')
 @login_required
+@conditional_get('borrow_record', 'book', per_user=True)
 def history():
     # Get search and pagination parameters from request (simplified)
     search = request.args.get('search', '').strip()
@@ -262,23 +263,17 @@ def history():
         per_page = 10
     
     # Get paginated borrow records (all statuses for history)
-    try:
-        result = BorrowService.get_borrows_paginated(
-            page=page,
-            per_page=per_page,
-            search=search,
-            status=None  # Show all records in history
-        )
-        return render_template('history.html', 
-                             records=result['items'],  # Use 'items' from pagination result
-                             pagination=result,        # Pass the entire result as pagination
-                             search=search,
-                             per_page=per_page,
-                             today=datetime.utcnow())
-    except (AttributeError, KeyError):
-        # Fallback to basic method if paginated method doesn't work properly
-        records = BorrowService.get_all_borrow_records()
-        return render_template('history.html', records=records, today=datetime.utcnow())
+    result = BorrowService.get_borrows_paginated(
+        page=page,
+        per_page=per_page,
+        search=search,
+        status=None  # Show all records in history
+    )
+    return render_template('history.html', 
+                         records=result['items'],  # Use 'items' from pagination result
+                         pagination=result,        # Pass the entire result as pagination
+                         search=search,
+                         per_page=per_page)
 
 @web_bp.route('/notifications')
 @login_required
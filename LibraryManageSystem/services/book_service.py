@@ -1,7 +1,23 @@
+from functools import lru_cache
+from flask import current_app
 from models import db
-from models.book import Book
+from models.book import Book, book_fts_match, has_book_fts, normalize_isbn
+from models.data_version import DataVersion
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+# Upper bound on search_books() results, so a broad query can't load the catalog
+SEARCH_LIMIT = 100
+
+def _load_book_dicts(version, query=None):
+    """Serialized books (all, or matching query) as of one book table version"""
+    books = BookService.get_all_books() if query is None else BookService.search_books(query)
+    return tuple(book.to_dict() for book in books)
+
 class BookService:
     @staticmethod
     def get_all_books():
@@ -11,29 +27,54 @@ class BookService:
     @staticmethod
     def get_book_by_id(book_id):
         """Get book by ID"""
-        return Book.query.get(book_id)
+        return db.session.get(Book, book_id)
     
     @staticmethod
     def get_book_by_isbn(isbn):
         """Get book by ISBN"""
-        return Book.query.filter_by(isbn=isbn).first()
+        return Book.query.filter_by(isbn=normalize_isbn(isbn)).first()
     
     @staticmethod
     def create_book(data):
         """Create a new book"""
-        # Check if book with this ISBN already exists
-        existing_book = BookService.get_book_by_isbn(data.get('isbn'))
-        if existing_book:
-            raise ValueError("Book with this ISBN already exists")
-        
-        book = Book.from_dict(data)
-        db.session.add(book)
+        # The unique constraint on isbn rejects duplicates, so there is no
+        # separate lookup first (one INSERT, and no check-then-insert race).
+        # Where supported, ON CONFLICT DO NOTHING turns a duplicate into "no
+        # row returned" instead of a failed statement.
+        conflict_insert = _CONFLICT_INSERTS.get(db.session.get_bind().dialect.name)
         try:
-            db.session.commit()
-            return book
+            if conflict_insert is None:
+                book = Book.from_dict(data)
+                db.session.add(book)
+            else:
+                # Core insert bypasses Book.validate_isbn, so normalize here
+                isbn = data.get('isbn')
+                book = db.session.scalar(
+                    conflict_insert(Book)
+                    .values(title=data.get('title'), author=data.get('author'),
+                            isbn=normalize_isbn(isbn) if isbn else isbn)
+                    .on_conflict_do_nothing(index_elements=['isbn'])
+                    .returning(Book)
+                )
+            if book is not None:
+                db.session.commit()
+                return book
         except IntegrityError:
-            db.session.rollback()
-            raise ValueError("Book with this ISBN already exists")
+            pass
+        # Also ends the no-row case's transaction, so nothing bumps the version
+        db.session.rollback()
+        raise ValueError("Book with this ISBN already exists")
+    
+    @staticmethod
+    def bulk_create_books(rows):
+        """Insert many books (a list of column dicts) in one statement and one commit"""
+        if rows:
+            # Core insert bypasses Book.validate_isbn, so normalize here
+            rows = [{**row, 'isbn': normalize_isbn(row['isbn'])} if row.get('isbn') else row
+                    for row in rows]
+            db.session.execute(insert(Book), rows)
+            db.session.commit()
+        return len(rows)
     
     @staticmethod
     def update_book(book_id, data):
@@ -42,13 +83,8 @@ class BookService:
         if not book:
             raise ValueError("Book not found")
         
-        # Check if updating ISBN conflicts with existing book
-        if 'isbn' in data and data['isbn'] != book.isbn:
-            existing_book = BookService.get_book_by_isbn(data['isbn'])
-            if existing_book:
-                raise ValueError("Book with this ISBN already exists")
-        
-        # Update book fields
+        # Update book fields (an ISBN that clashes with another book is
+        # rejected by the unique constraint on commit)
         for key, value in data.items():
             if hasattr(book, key):
                 setattr(book, key, value)
@@ -74,17 +110,69 @@ class BookService:
         db.session.commit()
         return True
     
+    @staticmethod
+    def get_book_counts():
+        """Count total and available books in one aggregate query"""
+        total, available = db.session.query(
+            db.func.count(Book.id),
+            db.func.count(Book.id).filter(Book.available == True)
+        ).one()
+        return {
+            'total': total,
+            'available': available,
+            'borrowed': total - available
+        }
+    
+    @staticmethod
+    def get_recent_books(limit=5):
+        """Get the most recently added books, oldest first
+
+        Plain column rows (the home page only renders these fields) rather
+        than ORM instances with identity-map tracking
+        """
+        books = db.session.execute(
+            db.select(Book.title, Book.author, Book.isbn, Book.available, Book.created_at)
+            .order_by(Book.id.desc()).limit(limit)
+        ).all()
+        return books[::-1]
+    
     @staticmethod
     def get_available_books():
         """Get all available books"""
         return Book.query.filter_by(available=True).all()
     
     @staticmethod
-    def search_books(query):
-        """Search books by title or author"""
+    def search_books(query, limit=SEARCH_LIMIT):
+        """Search books by title or author (at most limit results, by id)
+
+        Same matching as the paginated search (SearchFilter.apply_book_filters):
+        on SQLite a book_fts MATCH, where every word of the query must start a
+        word of the title or author; other databases, and SQLite before
+        book_fts exists, a substring match (trigram-indexed on PostgreSQL).
+        """
+        if not query.split():
+            return Book.query.order_by(Book.id).limit(limit).all()
+        
+        if db.session.get_bind().dialect.name == 'sqlite' and has_book_fts():
+            return Book.query.filter(book_fts_match(query)).order_by(Book.id).limit(limit).all()
         return Book.query.filter(
             Book.title.contains(query) | Book.author.contains(query)
-        ).all()
+        ).order_by(Book.id).limit(limit).all()
+    
+    @staticmethod
+    def get_book_dicts(query=None):
+        """Serialized get_all_books() / search_books(query), cached in memory
+
+        Entries are keyed on the book table's DataVersion counter, which every
+        write bumps (including borrows and returns flipping availability), so a
+        change makes old entries unreachable instead of needing invalidation.
+        The cache lives on the app, so separate apps/databases never share it.
+        """
+        load = current_app.extensions.get('book_dicts_cache')
+        if load is None:
+            load = current_app.extensions['book_dicts_cache'] = lru_cache(maxsize=64)(_load_book_dicts)
+        version = DataVersion.current(('book',))[0]
+        return list(load(version, query.lower() if query else None))
     
     @staticmethod
     def search_and_paginate_books(search_params, page=1, per_page=10):
@@ -113,8 +201,11 @@ class BookService:
             'available_only': available_only
         }
         
-        # Use the existing search_and_paginate_books method
-        result = BookService.search_and_paginate_books(search_params, page, per_page)
+        # The books page only renders these columns, so select plain rows
+        # instead of building a full Book instance per row
+        query = db.session.query(
+            Book.id, Book.title, Book.author, Book.isbn, Book.available, Book.created_at
+        )
+        query = SearchFilter.apply_book_filters(query, search_params)
         
-        return result
-    
+        return PaginationHelper.paginate_query(query, page, per_page)
@@ -5,8 +5,9 @@ import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from flask import current_app, has_app_context
+from sqlalchemy import update
 from models import db
-from models.borrow import BorrowRecord
+from models.borrow import BorrowRecord, request_now
 from models.book import Book
 from services.book_service import BookService
 
@@ -19,7 +20,7 @@ class BorrowService:
     @staticmethod
     def get_borrow_record_by_id(record_id):
         """Get borrow record by ID"""
-        return BorrowRecord.query.get(record_id)
+        return db.session.get(BorrowRecord, record_id)
     
     @staticmethod
     def get_active_borrows():
@@ -29,10 +30,7 @@ class BorrowService:
     @staticmethod
     def get_overdue_borrows():
         """Get all overdue borrow records"""
-        return BorrowRecord.query.filter(
-            BorrowRecord.returned == False,
-            BorrowRecord.due_date < datetime.utcnow()
-        ).all()
+        return BorrowRecord.query.filter(BorrowRecord.overdue_clause(request_now())).all()
     
     @staticmethod
     def get_borrower_history(borrower_email):
@@ -43,19 +41,25 @@ class BorrowService:
     def borrow_book(data):
         """Borrow a book"""
         book_id = data.get('book_id')
-        book = BookService.get_book_by_id(book_id)
 
-        if not book:
-            raise ValueError("Book not found")
+        # Mark book as unavailable with one conditional UPDATE: it replaces
+        # the SELECT + availability check, and two concurrent borrowers can
+        # no longer both pass the check
+        book_title = db.session.execute(
+            update(Book)
+            .where(Book.id == book_id, Book.available == True)
+            .values(available=False)
+            .returning(Book.title)
+        ).scalar()
 
-        if not book.available:
+        if book_title is None:
+            db.session.rollback()
+            if not BookService.get_book_by_id(book_id):
+                raise ValueError("Book not found")
             raise ValueError("Book is not available for borrowing")
 
         # Create borrow record
         borrow_record = BorrowRecord.from_dict(data)
-
-        # Mark book as unavailable
-        book.available = False
         db.session.add(borrow_record)
         db.session.commit()
 
@@ -67,8 +71,8 @@ class BorrowService:
                 "email": data.get("borrower_email")
             },
             "book": {
-                "id": book.id,
-                "title": book.title
+                "id": book_id,
+                "title": book_title
             },
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
@@ -90,7 +94,7 @@ class BorrowService:
         if has_app_context():
             try:
                 from services.notification_service import NotificationService
-                message = f"{data.get('borrower_name')} borrowed '{book.title}'"
+                message = f"{data.get('borrower_name')} borrowed '{book_title}'"
                 NotificationService.create_notification(event=payload['event'], message=message, payload=payload)
             except Exception as e:
                 # Non-fatal: log and continue
@@ -108,7 +112,7 @@ class BorrowService:
             recipient=admin_email,
             body=f"A book has been borrowed:\n\n"
                  f"User: {data.get('borrower_name')} ({data.get('borrower_email')})\n"
-                 f"Book: {book.title} (ID: {book.id})\n"
+                 f"Book: {book_title} (ID: {book_id})\n"
                  f"Timestamp: {datetime.utcnow().isoformat()}"
         )
 
@@ -198,24 +202,26 @@ class BorrowService:
     @staticmethod
     def return_book(record_id):
         """Return a borrowed book"""
-        record = BorrowService.get_borrow_record_by_id(record_id)
+        # Mark as returned only if it is still out, so a double return
+        # cannot flip the book's availability twice
+        book_id = db.session.execute(
+            update(BorrowRecord)
+            .where(BorrowRecord.id == record_id, BorrowRecord.returned == False)
+            .values(returned=True, return_date=datetime.utcnow())
+            .returning(BorrowRecord.book_id)
+        ).scalar()
         
-        if not record:
-            raise ValueError("Borrow record not found")
-        
-        if record.returned:
+        if book_id is None:
+            db.session.rollback()
+            if not BorrowService.get_borrow_record_by_id(record_id):
+                raise ValueError("Borrow record not found")
             raise ValueError("Book has already been returned")
         
-        # Mark as returned
-        record.returned = True
-        record.return_date = datetime.utcnow()
-        
         # Mark book as available
-        record.book.available = True
-        
+        db.session.execute(update(Book).where(Book.id == book_id).values(available=True))
         db.session.commit()
         
-        return record
+        return BorrowService.get_borrow_record_by_id(record_id)
     
     @staticmethod
     def extend_due_date(record_id, additional_days):
@@ -236,11 +242,18 @@ class BorrowService:
     
     @staticmethod
     def search_and_paginate_borrows(search_params, page=1, per_page=10):
-        """Search borrow records with pagination and filtering"""
+        """Search borrow records with pagination and filtering
+
+        Items are (record, is_overdue) rows: the overdue flag is evaluated in
+        the query against one clock reading, not once per record in to_dict()
+        """
         from utils.pagination_helpers import PaginationHelper, SearchFilter
         
         # Start with base query
-        query = BorrowRecord.query
+        query = db.session.query(
+            BorrowRecord,
+            BorrowRecord.overdue_clause(request_now()).label('is_overdue')
+        )
         
         # Apply search filters
         query = SearchFilter.apply_borrow_filters(query, search_params)
@@ -261,7 +274,24 @@ class BorrowService:
             'status': status or ''
         }
         
-        # Use the existing search_and_paginate_borrows method
-        result = BorrowService.search_and_paginate_borrows(search_params, page, per_page)
+        # Overdue means due before today (UTC); the database evaluates it per
+        # row instead of the template comparing dates in Python
+        today = datetime.combine(request_now().date(), datetime.min.time())
+        
+        # The borrow pages only render these columns, so select plain rows
+        # (with the book's title and author joined in) instead of ORM records
+        query = db.session.query(
+            BorrowRecord.id,
+            BorrowRecord.borrower_name,
+            BorrowRecord.borrower_email,
+            BorrowRecord.borrow_date,
+            BorrowRecord.due_date,
+            BorrowRecord.return_date,
+            BorrowRecord.returned,
+            Book.title.label('book_title'),
+            Book.author.label('book_author'),
+            (BorrowRecord.due_date < today).label('is_overdue')
+        ).join(Book, BorrowRecord.book_id == Book.id)
+        query = SearchFilter.apply_borrow_filters(query, search_params)
         
-        return result
\ No newline at end of file
+        return PaginationHelper.paginate_query(query, page, per_page)
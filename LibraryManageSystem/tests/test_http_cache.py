@@ -0,0 +1,72 @@
+"""
+ETag / 304 behaviour of conditional_get on the borrow pages
+
+Run from LibraryManageSystem/: python -m pytest tests
+"""
+import os
+from datetime import datetime
+
+import pytest
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+
+import app_swagger
+import models.borrow
+from models import db
+from models.book import Book
+from models.borrow import BorrowRecord
+
+# How both pages render an overdue record
+OVERDUE = b'font-weight: bold;">Overdue</span>'
+
+
+class FrozenClock(datetime):
+    """datetime whose utcnow() returns FrozenClock.now"""
+    now = None
+
+    @classmethod
+    def utcnow(cls):
+        return cls.now
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(models.borrow, 'datetime', FrozenClock)
+    app = app_swagger.create_app({
+        'TESTING': True,
+        'RATELIMIT_ENABLED': False,
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{tmp_path}/library.db',
+    })
+    with app.app_context():
+        db.create_all()
+        book = Book(title='Clean Code', author='Robert C. Martin', isbn='0132350882',
+                    available=False)
+        db.session.add(book)
+        db.session.flush()
+        db.session.add(BorrowRecord(book_id=book.id, borrower_name='Reader',
+                                    borrower_email='reader@example.com',
+                                    due_date=datetime(2026, 10, 15, 23, 0)))
+        db.session.commit()
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['user_id'] = 1
+    return client
+
+
+@pytest.mark.parametrize('path', ['/borrowed_books', '/history'])
+def test_borrow_page_etag_changes_at_midnight(client, path):
+    # Due at 23:00 on the 15th: the pages only call it overdue from the 16th,
+    # and no due_date lies between the two requests
+    FrozenClock.now = datetime(2026, 10, 15, 23, 30)
+    response = client.get(path)
+    assert response.status_code == 200
+    assert OVERDUE not in response.data
+    etag = response.headers['ETag']
+
+    assert client.get(path, headers={'If-None-Match': etag}).status_code == 304
+
+    FrozenClock.now = datetime(2026, 10, 16, 1, 0)
+    response = client.get(path, headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert OVERDUE in response.data
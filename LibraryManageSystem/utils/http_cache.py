@@ -0,0 +1,57 @@
+"""
+Conditional GET support (ETag / 304 Not Modified) for read-only routes
+"""
+from functools import wraps
+import hashlib
+from flask import request, session, current_app, after_this_request
+from models.borrow import BorrowRecord, request_now
+from models.data_version import DataVersion
+
+def conditional_get(*table_names, per_user=False):
+    """Decorator: answer 304 when the client's copy is still current
+
+    The ETag is derived from the data versions of table_names, so it only
+    changes when one of those tables is written. Checking it costs one small
+    query instead of running the route and rendering the response.
+    Borrow responses also carry is_overdue, which changes with time alone.
+    When borrow_record is listed, the ETag also includes the next upcoming
+    due_date (the API flags a record overdue the instant it passes) and the
+    UTC date (the borrow pages flag records due before today), so it
+    changes on both boundaries.
+
+    per_user: the response is a session-specific page (HTML views); the ETag
+    then includes the logged-in user, and pending flash messages always get a
+    fresh render so they are shown.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if per_user and '_flashes' in session:
+                return f(*args, **kwargs)
+
+            versions = DataVersion.current(table_names)
+            key = str(versions)
+            if 'borrow_record' in table_names:
+                now = request_now()
+                key += f"|{BorrowRecord.next_due_date(now)}|{now.date()}"
+            if per_user:
+                key += f"|{session.get('user_id')}"
+            etag = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+            cache_control = 'private, no-cache' if per_user else 'no-cache'
+
+            if request.if_none_match.contains(etag):
+                response = current_app.response_class(status=304)
+                response.set_etag(etag)
+                response.headers['Cache-Control'] = cache_control
+                return response
+
+            @after_this_request
+            def add_etag(response):
+                if response.status_code == 200:
+                    response.set_etag(etag)
+                    response.headers['Cache-Control'] = cache_control
+                return response
+
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
@@ -38,7 +38,12 @@ class PaginationHelper:
     
     @staticmethod
     def paginate_query(query, page, per_page):
-        """Apply pagination to SQLAlchemy query"""
+        """Apply pagination to SQLAlchemy query
+
+        per_page is capped at MAX_PAGE_SIZE here as well, so no caller (search
+        included) can load more than one bounded page of rows.
+        """
+        per_page = min(per_page, PaginationHelper.MAX_PAGE_SIZE)
         total = query.count()
         items = query.offset((page - 1) * per_page).limit(per_page).all()
         
@@ -95,12 +100,23 @@ class SearchFilter:
     
     @staticmethod
     def apply_book_filters(query, search_params):
-        """Apply search filters to book query (simplified)"""
-        from models.book import Book
+        """Apply search filters to book query (simplified)
+
+        On SQLite the search goes through the book_fts full-text index: each
+        word must start a word of the title or author ('mart' finds Martin,
+        'artin' does not). Other databases, and SQLite before book_fts exists,
+        match a substring with ILIKE (trigram-indexed on PostgreSQL).
+        """
+        from models import db
+        from models.book import Book, book_fts_match, has_book_fts
         
         # Text search in title and author
-        if search_params.get('search'):
-            search_term = f"%{search_params['search']}%"
+        search = search_params.get('search')
+        if search and db.session.get_bind().dialect.name == 'sqlite' and has_book_fts():
+            if search.split():
+                query = query.filter(book_fts_match(search))
+        elif search:
+            search_term = f"%{search}%"
             query = query.filter(
                 (Book.title.ilike(search_term)) | 
                 (Book.author.ilike(search_term))
@@ -118,7 +134,7 @@ class SearchFilter:
     @staticmethod
     def apply_borrow_filters(query, search_params):
         """Apply search filters to borrow query (simplified)"""
-        from models.borrow import BorrowRecord
+        from models.borrow import BorrowRecord, request_now
         
         # Search in borrower name and email
         if search_params.get('search'):
@@ -131,11 +147,7 @@ class SearchFilter:
         # Status filter
         if search_params.get('status'):
             if search_params['status'] == 'overdue':
-                from datetime import datetime
-                query = query.filter(
-                    BorrowRecord.returned == False,
-                    BorrowRecord.due_date < datetime.utcnow()
-                )
+                query = query.filter(BorrowRecord.overdue_clause(request_now()))
             elif search_params['status'] == 'borrowed':
                 query = query.filter(BorrowRecord.returned == False)
             elif search_params['status'] == 'returned':
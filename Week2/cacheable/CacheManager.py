@@ -17,6 +17,12 @@ from datetime import datetime, timedelta
 from functools import wraps
 import hashlib
 import json
+import os
+
+try:
+    import redis
+except ImportError:  # Redis is optional - fall back to the in-process dict
+    redis = None
 
 app = Flask(__name__)
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///library_cache.db'
@@ -24,10 +30,105 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
 db = SQLAlchemy(app)
 
-# Simple in-memory cache for demonstration
-# In production, use Redis, Memcached, or HTTP caching
+# Shared cache in Redis so every worker process sees the same entries.
+# Falls back to a simple in-memory dict when Redis is not reachable.
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+CACHE_PREFIX = 'cache:'
+
 cache_store = {}
 
+
+def _connect_redis():
+    """Return a pooled Redis client, or None if Redis is unavailable"""
+    if redis is None:
+        return None
+    try:
+        pool = redis.ConnectionPool.from_url(REDIS_URL, socket_connect_timeout=1)
+        client = redis.Redis(connection_pool=pool)
+        client.ping()
+        return client
+    except redis.RedisError as e:
+        print(f"[CACHE] Redis unavailable ({e}) - using in-memory cache")
+        return None
+
+
+redis_client = _connect_redis()
+
+
+def _redis_failed(e):
+    """Redis went away after startup: serve this call from the local dict"""
+    print(f"[CACHE] Redis error ({e}) - falling back to in-memory cache")
+
+
+def cache_get(key):
+    """Read a cache entry from Redis (or the local dict fallback)"""
+    if redis_client is not None:
+        try:
+            raw = redis_client.get(CACHE_PREFIX + key)
+        except redis.RedisError as e:
+            _redis_failed(e)
+        else:
+            if raw is None:
+                return None
+            entry = json.loads(raw)
+            entry['cached_at'] = datetime.fromisoformat(entry['cached_at'])
+            entry['expires'] = datetime.fromisoformat(entry['expires'])
+            return entry
+    
+    return cache_store.get(key)
+
+
+def cache_set(key, entry, max_age):
+    """Store a cache entry; Redis expires it after max_age seconds"""
+    if redis_client is not None:
+        payload = dict(entry,
+                       cached_at=entry['cached_at'].isoformat(),
+                       expires=entry['expires'].isoformat())
+        try:
+            redis_client.set(CACHE_PREFIX + key, json.dumps(payload), ex=max_age)
+            return
+        except redis.RedisError as e:
+            _redis_failed(e)
+    
+    cache_store[key] = entry
+
+
+def cache_keys(pattern='*'):
+    """List cached keys (without the Redis prefix)"""
+    if redis_client is not None:
+        offset = len(CACHE_PREFIX)
+        try:
+            return [key.decode()[offset:]
+                    for key in redis_client.scan_iter(match=CACHE_PREFIX + pattern)]
+        except redis.RedisError as e:
+            _redis_failed(e)
+    
+    return list(cache_store.keys())
+
+
+def cache_delete_matching(pattern='*'):
+    """Delete cached keys matching pattern, batching the DELs in one pipeline"""
+    # Entries stored locally while Redis was down must go as well
+    prefix = pattern.rstrip('*')
+    keys_to_remove = [key for key in cache_store.keys() if key.startswith(prefix)]
+    for key in keys_to_remove:
+        del cache_store[key]
+    
+    if redis_client is None:
+        return len(keys_to_remove)
+    
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        count = 0
+        for key in redis_client.scan_iter(match=CACHE_PREFIX + pattern):
+            pipe.delete(key)
+            count += 1
+        pipe.execute()
+    except redis.RedisError as e:
+        _redis_failed(e)
+        return len(keys_to_remove)
+    return count + len(keys_to_remove)
+
 class Book(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
@@ -67,8 +168,8 @@ def cacheable(max_age=300):
             cache_key = f"{request.path}?{request.query_string.decode()}"
             
             # Check cache
-            if cache_key in cache_store:
-                cached_data = cache_store[cache_key]
+            cached_data = cache_get(cache_key)
+            if cached_data is not None:
                 server_etag = cached_data['etag']
                 
                 # If client's ETag matches, return 304 Not Modified
@@ -105,12 +206,12 @@ def cacheable(max_age=300):
                 etag = hashlib.md5(json.dumps(response_data).encode()).hexdigest()
                 
                 # Store in cache
-                cache_store[cache_key] = {
+                cache_set(cache_key, {
                     'data': response_data,
                     'etag': etag,
                     'cached_at': datetime.utcnow(),
                     'expires': datetime.utcnow() + timedelta(seconds=max_age)
-                }
+                }, max_age)
                 
                 # Create response with cache headers
                 response = make_response(jsonify(response_data), status_code)
@@ -175,7 +276,7 @@ def get_book(book_id):
     CACHEABLE: Individual book details
     Uses ETag for validation
     """
-    book = Book.query.get(book_id)
+    book = db.session.get(Book, book_id)
     
     if not book:
         return {
@@ -249,7 +350,7 @@ def update_book(book_id):
     NON-CACHEABLE: Updates modify data
     Must not be cached
     """
-    book = Book.query.get(book_id)
+    book = db.session.get(Book, book_id)
     
     if not book:
         return {
@@ -305,7 +406,7 @@ def get_realtime_stats():
 @app.route('/api/cache/clear', methods=['POST'])
 def clear_cache():
     """Clear all cached data"""
-    cache_store.clear()
+    cache_delete_matching('*')
     return jsonify({
         'success': True,
         'message': 'Cache cleared'
@@ -315,21 +416,21 @@ def clear_cache():
 @app.route('/api/cache/status', methods=['GET'])
 def cache_status():
     """Get cache statistics"""
+    keys = cache_keys()
     return jsonify({
         'success': True,
         'data': {
-            'cached_entries': len(cache_store),
-            'cache_keys': list(cache_store.keys())
+            'backend': 'redis' if redis_client is not None else 'memory',
+            'cached_entries': len(keys),
+            'cache_keys': keys
         }
     })
 
 
 def invalidate_book_caches():
     """Invalidate all book-related caches when data changes"""
-    keys_to_remove = [key for key in cache_store.keys() if '/api/books' in key]
-    for key in keys_to_remove:
-        del cache_store[key]
-    print(f"[CACHE] Invalidated {len(keys_to_remove)} entries")
+    removed = cache_delete_matching('/api/books*')
+    print(f"[CACHE] Invalidated {removed} entries")
 
 
 if __name__ == '__main__':
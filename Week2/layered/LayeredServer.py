@@ -49,13 +49,13 @@ class DataAccessLayer:
     
     def get_book_by_id(self, book_id):
         """Get single book by ID"""
-        self.logger.info(f"Fetching book ID {book_id} from database")
+        self.logger.info("Fetching book ID %s from database", book_id)
         from models import Book
-        return Book.query.get(book_id)
+        return self.db.session.get(Book, book_id)
     
     def create_book(self, title, author, isbn):
         """Create new book record"""
-        self.logger.info(f"Creating book: {title}")
+        self.logger.info("Creating book: %s", title)
         from models import Book
         book = Book(title=title, author=author, isbn=isbn)
         self.db.session.add(book)
@@ -64,7 +64,7 @@ class DataAccessLayer:
     
     def update_book(self, book, **kwargs):
         """Update book attributes"""
-        self.logger.info(f"Updating book ID {book.id}")
+        self.logger.info("Updating book ID %s", book.id)
         for key, value in kwargs.items():
             if hasattr(book, key):
                 setattr(book, key, value)
@@ -73,7 +73,7 @@ class DataAccessLayer:
     
     def delete_book(self, book):
         """Delete book from database"""
-        self.logger.info(f"Deleting book ID {book.id}")
+        self.logger.info("Deleting book ID %s", book.id)
         self.db.session.delete(book)
         self.db.session.commit()
 
@@ -104,7 +104,7 @@ class BusinessLogicLayer:
     
     def get_book(self, book_id):
         """Get book with validation"""
-        self.logger.info(f"Processing: Get book {book_id}")
+        self.logger.info("Processing: Get book %s", book_id)
         book = self.dal.get_book_by_id(book_id)
         
         if not book:
@@ -133,12 +133,12 @@ class BusinessLogicLayer:
             raise ValueError(f"Book with ISBN {isbn} already exists")
         
         book = self.dal.create_book(title, author, isbn)
-        self.logger.info(f"✓ Book created: {book.title}")
+        self.logger.info("✓ Book created: %s", book.title)
         return self._book_to_dict(book)
     
     def update_book_availability(self, book_id, available):
         """Update book availability with business logic"""
-        self.logger.info(f"Processing: Update availability for book {book_id}")
+        self.logger.info("Processing: Update availability for book %s", book_id)
         
         book = self.dal.get_book_by_id(book_id)
         if not book:
@@ -146,7 +146,7 @@ class BusinessLogicLayer:
         
         # Business rule: Can only update availability status
         self.dal.update_book(book, available=available)
-        self.logger.info(f"✓ Book {book_id} availability: {available}")
+        self.logger.info("✓ Book %s availability: %s", book_id, available)
         return self._book_to_dict(book)
     
     def _book_to_dict(self, book):
@@ -190,7 +190,7 @@ class PresentationLayer:
     
     def handle_get_book(self, book_id):
         """Handle GET /books/<id> request"""
-        self.logger.info(f"Request: GET /books/{book_id}")
+        self.logger.info("Request: GET /books/%s", book_id)
         try:
             book = self.bll.get_book(book_id)
             return self._success_response(book)
@@ -230,7 +230,7 @@ class PresentationLayer:
     
     def handle_update_availability(self, book_id, request_data):
         """Handle PUT /books/<id>/availability request"""
-        self.logger.info(f"Request: PUT /books/{book_id}/availability")
+        self.logger.info("Request: PUT /books/%s/availability", book_id)
         
         if 'available' not in request_data:
             return self._error_response("'available' field required", 400)
@@ -5,24 +5,132 @@ Adds uniform interface to Version 2 (keeps all caching).
 Key idea: Standard HTTP methods + HATEOAS links + better errors.
 """
 
-from flask import Flask, jsonify, request, url_for
+from flask import Flask, Response, g, jsonify, request, url_for
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import object_session
+from cachetools import TTLCache
+from concurrent.futures import Future
 from datetime import datetime
+from functools import lru_cache
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
 
 app = Flask(__name__)
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///library_v3.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Writer pool of one connection (SQLite only allows one writer anyway);
+# GET handlers read through a separate read-only pool sized to the CPU count
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'pool_size': 1, 'max_overflow': 0}
+app.config['SQLALCHEMY_BINDS'] = {
+    'ro': {
+        'url': 'sqlite:///file:library_v3.db?mode=ro&uri=true',
+        'pool_size': os.cpu_count() or 4,
+    }
+}
+
+# Keep attribute values after commit (no re-SELECT to read a just-written book)
+# and only flush when a write asks for it
+db = SQLAlchemy(app, session_options={'expire_on_commit': False, 'autoflush': False})
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune every new SQLite connection: WAL journal, fewer fsyncs, bigger cache"""
+    cursor = dbapi_connection.cursor()
+    for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "busy_timeout=5000",
+                   "cache_size=-20000", "temp_store=MEMORY"):
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+# pysqlite never emits BEGIN before a SAVEPOINT, so each per-write savepoint
+# in the writer would start outside a transaction and its RELEASE would commit
+# (and fsync) on its own. Take transaction control away from the driver on the
+# writer engine and open every transaction with BEGIN IMMEDIATE ourselves,
+# which also grabs the write lock up front instead of upgrading mid-batch.
+with app.app_context():
+    writer_engine = db.engine
+
+@event.listens_for(writer_engine, "connect")
+def disable_pysqlite_begin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(writer_engine, "begin")
+def begin_immediate(connection):
+    connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+def read_only():
+    """Bind arguments that route a query to the read-only pool"""
+    return {'bind': db.engines['ro']}
+
+def api_base_url():
+    """Root URL of the current request (no trailing slash), computed once per request"""
+    if 'api_base_url' not in g:
+        g.api_base_url = request.url_root.rstrip('/')
+    return g.api_base_url
+
+def book_links(book_id):
+    """HATEOAS links for one book, built without a url_for call per book"""
+    return links_for_book(api_base_url(), book_id)
+
+@lru_cache(maxsize=4096)
+def links_for_book(base_url, book_id):
+    """Links only depend on host and id, so each pair is built once and shared.
+    Callers must treat the returned dict as read-only."""
+    # All three links share one URL
+    href = f'{base_url}/api/books/{book_id}'
+    return {
+        'self': {
+            'href': href,
+            'method': 'GET'
+        },
+        'update': {
+            'href': href,
+            'method': 'PUT'
+        },
+        'delete': {
+            'href': href,
+            'method': 'DELETE'
+        }
+    }
+
+def encode_json(data):
+    """Encode a body once, in the same compact, sorted layout jsonify produces"""
+    return json.dumps(data, separators=(',', ':'), sort_keys=True).encode()
 
-db = SQLAlchemy(app)
+def json_response(body, status=200):
+    """Send a pre-encoded JSON body"""
+    return Response(body, status=status, mimetype='application/json')
 
-cache = {}
+def encode_error(code, message):
+    """Encode a standard error body"""
+    return encode_json({
+        'success': False,
+        'error': {
+            'code': code,
+            'message': message
+        }
+    })
+
+# Static error bodies, encoded at import instead of on every failed request
+ERROR_INVALID_REQUEST = encode_error('INVALID_REQUEST', 'Request body must be JSON')
+ERROR_DUPLICATE_ISBN = encode_error('DUPLICATE_ISBN', 'Book with this ISBN already exists')
+ERROR_BOOK_NOT_FOUND = encode_error('BOOK_NOT_FOUND', 'Book with ID %d not found')
+
+# Bounded LRU cache: at most 1024 entries, each expires after 5 minutes
+cache = TTLCache(maxsize=1024, ttl=300)
 
 class Book(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     author = db.Column(db.String(100), nullable=False)
     isbn = db.Column(db.String(13), unique=True, nullable=False)
-    available = db.Column(db.Boolean, default=True)
+    available = db.Column(db.Boolean, default=True, index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     def to_dict(self, include_links=True):
@@ -37,20 +145,7 @@ class Book(db.Model):
         
         # NEW in Version 3: Add HATEOAS links
         if include_links:
-            data['_links'] = {
-                'self': {
-                    'href': url_for('get_book', book_id=self.id, _external=True),
-                    'method': 'GET'
-                },
-                'update': {
-                    'href': url_for('update_book', book_id=self.id, _external=True),
-                    'method': 'PUT'
-                },
-                'delete': {
-                    'href': url_for('delete_book', book_id=self.id, _external=True),
-                    'method': 'DELETE'
-                }
-            }
+            data['_links'] = book_links(self.id)
         
         return data
 
@@ -59,47 +154,193 @@ def clear_cache():
     cache.clear()
     print("[CACHE] Cleared all cached data")
 
+def cache_json(cache_key, data):
+    """Serialize data once; the cache keeps the body bytes and their ETag"""
+    body = app.json.dumps(data).encode()
+    entry = cache[cache_key] = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+    return entry
+
+def cached_response(entry, max_age, cache_status):
+    """Serve cached bytes as-is, or 304 if the client already has this ETag"""
+    body, etag = entry
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'max-age={max_age}'
+    response.headers['X-Cache-Status'] = cache_status
+    return response
+
+# Evict only the cache entries a write actually touches. Hooked to the model
+# so every write path invalidates, without manual clear_cache() calls.
+# Flush only records the keys; they are evicted once the transaction commits,
+# so a GET between flush and COMMIT cannot re-cache the old rows.
+def queue_eviction(target, *keys):
+    object_session(target).info.setdefault('evict_keys', set()).update(keys)
+
+@event.listens_for(Book, 'after_insert')
+def evict_on_insert(mapper, connection, target):
+    queue_eviction(target, 'all_books')
+
+@event.listens_for(Book, 'after_update')
+@event.listens_for(Book, 'after_delete')
+def evict_on_change(mapper, connection, target):
+    # the list embeds every book's fields
+    queue_eviction(target, f'book_{target.id}', 'all_books')
+
+@event.listens_for(db.session, 'after_commit')
+def evict_committed(session):
+    for key in session.info.pop('evict_keys', ()):
+        cache.pop(key, None)
+
+@event.listens_for(db.session, 'after_rollback')
+def forget_evictions(session):
+    session.info.pop('evict_keys', None)
+
+# Single writer: SQLite allows one writer at a time, so every INSERT, UPDATE
+# and DELETE runs on one dedicated thread that owns the write connection.
+# Request threads (or the ASGI loop's worker threads) only wait on a Future
+# and never contend for the write lock among themselves.
+write_queue = queue.Queue()
+
+def submit_write(operation, *args):
+    """Run a write operation on the writer thread and return its result"""
+    future = Future()
+    write_queue.put((operation, args, future))
+    return future.result()
+
+# Group commit: one COMMIT (one fsync) covers up to 32 writes queued within 5 ms
+WRITE_BATCH_SIZE = 32
+WRITE_BATCH_WINDOW = 0.005  # seconds
+
+def next_write_batch():
+    """Block for one write, then gather more until the batch is full or the window closes"""
+    batch = [write_queue.get()]
+    deadline = time.monotonic() + WRITE_BATCH_WINDOW
+    while len(batch) < WRITE_BATCH_SIZE:
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(write_queue.get(timeout=timeout))
+        except queue.Empty:
+            break
+    return batch
+
+def run_write_batch(batch):
+    """Run a batch of writes in one transaction and settle their futures"""
+    done = []
+    for operation, args, future in batch:
+        # A savepoint per operation, so one failure (e.g. a duplicate
+        # ISBN) only rolls back that write, not the whole batch
+        try:
+            with db.session.begin_nested():
+                result = operation(*args)
+        except Exception as exc:
+            future.set_exception(exc)
+        else:
+            done.append((future, result))
+    try:
+        db.session.commit()
+    except Exception as exc:
+        db.session.rollback()
+        for future, _ in done:
+            future.set_exception(exc)
+    else:
+        # Only report success once the batch is durable
+        for future, result in done:
+            future.set_result(result)
+
+def writer_loop():
+    """Drain the write queue forever, one transaction per batch"""
+    with app.app_context():
+        while True:
+            run_write_batch(next_write_batch())
+
+threading.Thread(target=writer_loop, name='sqlite-writer', daemon=True).start()
+
+# Write operations run on the writer thread, outside any request, so they
+# return books without links; handlers add links for the current host.
+def insert_book(title, author, isbn):
+    book = Book(title=title, author=author, isbn=isbn)
+    db.session.add(book)
+    db.session.flush()  # fills in id and created_at before serializing
+    return book.to_dict(include_links=False)
+
+def update_book_fields(book_id, fields):
+    book = db.session.get(Book, book_id)
+    if not book:
+        return None
+    for name, value in fields.items():
+        setattr(book, name, value)
+    db.session.flush()
+    return book.to_dict(include_links=False)
+
+def delete_book_row(book_id):
+    book = db.session.get(Book, book_id)
+    if not book:
+        return False
+    db.session.delete(book)
+    return True
+
 # NEW in Version 3: API root with links
-@app.route('/api', methods=['GET'])
-def api_root():
-    """API entry point - shows available endpoints"""
-    return jsonify({
+@lru_cache(maxsize=16)
+def encode_api_root(base_url):
+    """The root document only varies by host, so encode it once per base URL"""
+    return encode_json({
         'message': 'Library Management API',
         'version': '3.0 - Simple Uniform Interface',
         '_links': {
             'books': {
-                'href': url_for('get_books', _external=True),
+                'href': f'{base_url}/api/books',
                 'method': 'GET',
                 'description': 'Get all books'
             },
             'create_book': {
-                'href': url_for('create_book', _external=True),
+                'href': f'{base_url}/api/books',
                 'method': 'POST',
                 'description': 'Create a new book'
             }
         }
     })
 
+@app.route('/api', methods=['GET'])
+def api_root():
+    """API entry point - shows available endpoints"""
+    return json_response(encode_api_root(api_base_url()))
+
 # GET - Read data (cacheable, same as Version 2)
 @app.route('/api/books', methods=['GET'])
 def get_books():
     """GET books - cacheable with HATEOAS links"""
     cache_key = 'all_books'
     
-    if cache_key in cache:
+    entry = cache.get(cache_key)
+    if entry:
         print(f"[CACHE] HIT - returning books from cache")
-        response = jsonify(cache[cache_key])
-        response.headers['Cache-Control'] = 'max-age=300'
-        response.headers['X-Cache-Status'] = 'HIT'
-        return response
+        return cached_response(entry, 300, 'HIT')
     
     print(f"[CACHE] MISS - getting books from database")
-    books = Book.query.all()
+    # Plain column rows: no ORM objects to hydrate for a read-only list
+    books = db.session.execute(
+        db.select(Book.id, Book.title, Book.author, Book.isbn,
+                  Book.available, Book.created_at),
+        bind_arguments=read_only()
+    ).all()
     
     # NEW: Enhanced response with links
     data = {
         'success': True,
-        'data': [book.to_dict() for book in books],
+        'data': [{
+            'id': book.id,
+            'title': book.title,
+            'author': book.author,
+            'isbn': book.isbn,
+            'available': book.available,
+            'created_at': book.created_at.isoformat() if book.created_at else None,
+            '_links': book_links(book.id)
+        } for book in books],
         'count': len(books),
         'message': f'Found {len(books)} books',
         '_links': {
@@ -114,27 +355,20 @@ def get_books():
         }
     }
     
-    cache[cache_key] = data
-    
-    response = jsonify(data)
-    response.headers['Cache-Control'] = 'max-age=300'
-    response.headers['X-Cache-Status'] = 'MISS'
-    return response
+    return cached_response(cache_json(cache_key, data), 300, 'MISS')
 
 @app.route('/api/books/<int:book_id>', methods=['GET'])
 def get_book(book_id):
     """GET single book - cacheable with links"""
     cache_key = f'book_{book_id}'
     
-    if cache_key in cache:
+    entry = cache.get(cache_key)
+    if entry:
         print(f"[CACHE] HIT - book {book_id} from cache")
-        response = jsonify(cache[cache_key])
-        response.headers['Cache-Control'] = 'max-age=600'
-        response.headers['X-Cache-Status'] = 'HIT'
-        return response
+        return cached_response(entry, 600, 'HIT')
     
     print(f"[CACHE] MISS - getting book {book_id} from database")
-    book = Book.query.get(book_id)
+    book = db.session.get(Book, book_id, bind_arguments=read_only())
     
     # NEW: Better error with links
     if not book:
@@ -157,12 +391,7 @@ def get_book(book_id):
         'data': book.to_dict()
     }
     
-    cache[cache_key] = data
-    
-    response = jsonify(data)
-    response.headers['Cache-Control'] = 'max-age=600'
-    response.headers['X-Cache-Status'] = 'MISS'
-    return response
+    return cached_response(cache_json(cache_key, data), 600, 'MISS')
 
 # POST - Create data (not cacheable, same as Version 2)
 @app.route('/api/books', methods=['POST'])
@@ -172,13 +401,7 @@ def create_book():
     
     # NEW: Better error messages
     if not data:
-        return jsonify({
-            'success': False,
-            'error': {
-                'code': 'INVALID_REQUEST',
-                'message': 'Request body must be JSON'
-            }
-        }), 400
+        return json_response(ERROR_INVALID_REQUEST, 400)
     
     required = ['title', 'author', 'isbn']
     missing = [f for f in required if f not in data]
@@ -193,77 +416,51 @@ def create_book():
             }
         }), 400
     
-    existing_book = Book.query.filter_by(isbn=data['isbn']).first()
-    if existing_book:
-        return jsonify({
-            'success': False,
-            'error': {
-                'code': 'DUPLICATE_ISBN',
-                'message': 'Book with this ISBN already exists'
-            }
-        }), 400
-    
-    book = Book(
-        title=data['title'],
-        author=data['author'],
-        isbn=data['isbn']
-    )
-    
-    db.session.add(book)
-    db.session.commit()
-    
-    clear_cache()
+    # The unique constraint on isbn does the duplicate check, so the happy
+    # path is a single INSERT
+    try:
+        book_data = submit_write(insert_book, data['title'], data['author'], data['isbn'])
+    except IntegrityError as e:
+        # Only the unique isbn constraint means a duplicate; anything else
+        # (NOT NULL, CHECK) is a server-side failure, not the client's ISBN
+        if 'UNIQUE' not in str(e.orig):
+            raise
+        return json_response(ERROR_DUPLICATE_ISBN, 400)
+    book_data['_links'] = book_links(book_data['id'])
     
     # NEW: Enhanced success response
     response = jsonify({
         'success': True,
-        'data': book.to_dict(),
+        'data': book_data,
         'message': 'Book created successfully'
     })
     response.headers['Cache-Control'] = 'no-cache'
-    response.headers['Location'] = url_for('get_book', book_id=book.id, _external=True)
+    response.headers['Location'] = url_for('get_book', book_id=book_data['id'], _external=True)
     return response, 201 
 
 # NEW in Version 3: PUT - Update data
 @app.route('/api/books/<int:book_id>', methods=['PUT'])
 def update_book(book_id):
     """PUT - Update entire book"""
-    book = Book.query.get(book_id)
+    data = request.get_json(silent=True)
     
-    if not book:
-        return jsonify({
-            'success': False,
-            'error': {
-                'code': 'BOOK_NOT_FOUND',
-                'message': f'Book with ID {book_id} not found'
-            }
-        }), 404
+    # Update fields (only these can change)
+    fields = {}
+    if data:
+        fields = {name: data[name] for name in ('title', 'author', 'available') if name in data}
+    book_data = submit_write(update_book_fields, book_id, fields)
     
-    data = request.get_json()
+    if book_data is None:
+        return json_response(ERROR_BOOK_NOT_FOUND % book_id, 404)
     
     if not data:
-        return jsonify({
-            'success': False,
-            'error': {
-                'code': 'INVALID_REQUEST',
-                'message': 'Request body must be JSON'
-            }
-        }), 400
-    
-    # Update fields
-    if 'title' in data:
-        book.title = data['title']
-    if 'author' in data:
-        book.author = data['author']
-    if 'available' in data:
-        book.available = data['available']
+        return json_response(ERROR_INVALID_REQUEST, 400)
     
-    db.session.commit()
-    clear_cache()
+    book_data['_links'] = book_links(book_id)
     
     response = jsonify({
         'success': True,
-        'data': book.to_dict(),
+        'data': book_data,
         'message': 'Book updated successfully'
     })
     response.headers['Cache-Control'] = 'no-cache'
@@ -273,20 +470,8 @@ def update_book(book_id):
 @app.route('/api/books/<int:book_id>', methods=['DELETE'])
 def delete_book(book_id):
     """DELETE - Remove book"""
-    book = Book.query.get(book_id)
-    
-    if not book:
-        return jsonify({
-            'success': False,
-            'error': {
-                'code': 'BOOK_NOT_FOUND',
-                'message': f'Book with ID {book_id} not found'
-            }
-        }), 404
-    
-    db.session.delete(book)
-    db.session.commit()
-    clear_cache()
+    if not submit_write(delete_book_row, book_id):
+        return json_response(ERROR_BOOK_NOT_FOUND % book_id, 404)
     
     return '', 204
 
@@ -294,8 +479,12 @@ def delete_book(book_id):
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """Real-time stats - never cached"""
-    total = Book.query.count()
-    available = Book.query.filter_by(available=True).count()
+    # One pass over the table: COUNT(*) and COUNT(*) FILTER (WHERE available)
+    total, available = db.session.execute(
+        db.select(db.func.count(), db.func.count().filter(Book.available == True))
+        .select_from(Book),
+        bind_arguments=read_only()
+    ).one()
     borrowed = total - available
     
     response = jsonify({
@@ -338,21 +527,24 @@ def clear_cache_endpoint():
         'message': 'Cache cleared successfully'
     })
 
+# Health body never changes while the process runs: encode it once
+HEALTH_BODY = encode_json({
+    'status': 'healthy',
+    'service': 'Library Management Server',
+    'version': '3.0 - Simple Uniform Interface',
+    'features': [
+        'Client-Server separation (v1)',
+        'Basic HTTP caching (v2)',
+        'Standard HTTP methods (v3)',
+        'HATEOAS links (v3)',
+        'Better error messages (v3)'
+    ]
+})
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check with version info"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'Library Management Server',
-        'version': '3.0 - Simple Uniform Interface',
-        'features': [
-            'Client-Server separation (v1)',
-            'Basic HTTP caching (v2)',
-            'Standard HTTP methods (v3)',
-            'HATEOAS links (v3)',
-            'Better error messages (v3)'
-        ]
-    })
+    return json_response(HEALTH_BODY)
 
 if __name__ == '__main__':
     with app.app_context():
@@ -380,4 +572,6 @@ if __name__ == '__main__':
     print("   Consistent response format")
     print("   All caching features from Version 2")
     
-    app.run(debug=True, port=5001)
\ No newline at end of file
+    # Dev server only; the reloader and debugger stay off unless FLASK_DEV=1.
+    # For real load use gunicorn (see README)
+    app.run(debug=os.environ.get('FLASK_DEV') == '1', port=5001)
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Group commit check for the Version 3 writer thread
+
+Run from this folder: python -m unittest test_writer
+"""
+
+import unittest
+import uuid
+from concurrent.futures import Future
+
+from Server import Book, app, db, delete_book_row, insert_book, run_write_batch, writer_engine
+
+
+class WriterBatchTest(unittest.TestCase):
+    def setUp(self):
+        with app.app_context():
+            db.create_all()
+        # Record every statement SQLite itself executes on the (single)
+        # writer connection, including BEGIN/COMMIT issued by the driver
+        self.statements = []
+        with writer_engine.connect() as connection:
+            self.dbapi_connection = connection.connection.dbapi_connection
+        self.dbapi_connection.set_trace_callback(self.statements.append)
+
+    def tearDown(self):
+        self.dbapi_connection.set_trace_callback(None)
+
+    def run_batch(self, *writes):
+        batch = [(operation, args, Future()) for operation, *args in writes]
+        with app.app_context():
+            run_write_batch(batch)
+        return [future.exception() or future.result() for _, _, future in batch]
+
+    def transaction_statements(self):
+        # Savepoint statements (SAVEPOINT, RELEASE, ROLLBACK TO) are left out
+        return [sql for sql in self.statements
+                if sql.startswith('BEGIN') or sql in ('COMMIT', 'ROLLBACK')]
+
+    def test_one_commit_per_batch(self):
+        isbns = [uuid.uuid4().hex[:13] for _ in range(3)]
+        results = self.run_batch(*[(insert_book, 'Title', 'Author', isbn) for isbn in isbns])
+
+        self.assertEqual([book['isbn'] for book in results], isbns)
+        self.assertEqual(self.transaction_statements(), ['BEGIN IMMEDIATE', 'COMMIT'])
+        self.assertEqual(self.statements[0], 'BEGIN IMMEDIATE')
+        self.assertEqual(self.statements[-1], 'COMMIT')
+
+        self.statements.clear()
+        self.run_batch(*[(delete_book_row, book['id']) for book in results])
+        self.assertEqual(self.transaction_statements(), ['BEGIN IMMEDIATE', 'COMMIT'])
+
+    def test_failed_write_only_rolls_back_its_savepoint(self):
+        isbn = uuid.uuid4().hex[:13]
+        first, duplicate = self.run_batch((insert_book, 'Title', 'Author', isbn),
+                                          (insert_book, 'Title', 'Author', isbn))
+
+        self.assertEqual(first['isbn'], isbn)
+        self.assertIsInstance(duplicate, Exception)
+        self.assertEqual(self.transaction_statements(), ['BEGIN IMMEDIATE', 'COMMIT'])
+        with app.app_context():
+            self.assertIsNotNone(db.session.get(Book, first['id']))
+
+        self.run_batch((delete_book_row, first['id']))
+
+
+if __name__ == '__main__':
+    unittest.main()
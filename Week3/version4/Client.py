@@ -7,12 +7,20 @@ Shows how to work with stateless API (must send API key with every request).
 import requests
 import time
 
+try:
+    from orjson import loads  # faster JSON decoding when available
+except ImportError:
+    from json import loads
+
 class StatelessClient:
-    def __init__(self, base_url='http://127.0.0.1:5001'):
+    def __init__(self, base_url='http://127.0.0.1:5001', verbose=True):
         self.base_url = base_url
+        self.verbose = verbose  # set False to skip per-request logging under load
         self.session = requests.Session()
         self.api_key = None
         self.user_email = None
+        self._auth_headers = None
+        self._auth_log = None
     
     def authenticate(self, email):
         """Get API key for stateless authentication"""
@@ -28,6 +36,9 @@ class StatelessClient:
             data = response.json()
             self.api_key = data['data']['api_key']
             self.user_email = data['data']['email']
+            # The key never changes after this, so format the header once
+            self._auth_headers = {'Authorization': f'Bearer {self.api_key}'}
+            self._auth_log = f'Bearer {self.api_key[:10]}...'
             
             print(f"   {data['message']}")
             print(f"  API Key: {self.api_key}")
@@ -46,34 +57,33 @@ class StatelessClient:
             return None, False
         
         # IMPORTANT: Add Authorization header to EVERY request
-        headers = kwargs.get('headers', {})
-        headers['Authorization'] = f'Bearer {self.api_key}'
-        kwargs['headers'] = headers
+        kwargs.setdefault('headers', {}).update(self._auth_headers)
         
         url = f'{self.base_url}{endpoint}'
         
         try:
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             response = self.session.request(method, url, **kwargs)
-            duration = (time.time() - start_time) * 1000
             
-            print(f"  Request: {method} {endpoint}")
-            print(f"  Authorization: Bearer {self.api_key[:10]}...")
-            print(f"  Response time: {duration:.0f}ms")
-            print(f"  Status: {response.status_code}")
+            if self.verbose:
+                duration = (time.perf_counter_ns() - start_time) / 1_000_000
+                print(f"  Request: {method} {endpoint}\n"
+                      f"  Authorization: {self._auth_log}\n"
+                      f"  Response time: {duration:.0f}ms\n"
+                      f"  Status: {response.status_code}")
             
             if response.status_code == 204:  
                 return None, False
             elif response.status_code in [200, 201]:
-                return response.json(), False
+                return loads(response.content), False
             elif response.status_code == 401:
-                data = response.json()
+                data = loads(response.content)
                 error = data.get('error', {})
                 print(f"   Authentication error: {error.get('message')}")
                 return data, False
             else:
                 try:
-                    return response.json(), False
+                    return loads(response.content), False
                 except:
                     return {'error': {'message': f'HTTP {response.status_code}'}}, False
                     
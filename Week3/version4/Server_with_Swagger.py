@@ -10,6 +10,7 @@ from flask_restx import Api
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
 import base64
+import sqlite_pragmas  # noqa: F401  registers the SQLite connect listener
 
 app = Flask(__name__)
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///library_v4_swagger.db'
@@ -0,0 +1,20 @@
+"""
+Version 4: ASGI entry point (Swagger server)
+
+Wraps the Flask (WSGI) app so it can be served by uvicorn:
+
+    uvicorn asgi:application --workers 4 --loop uvloop --http httptools
+
+WsgiToAsgi runs the app through sync_to_async(thread_sensitive=True), i.e.
+on one thread per worker process, so each worker still handles one request
+at a time: concurrency comes only from the number of workers.
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from Server_with_Swagger import app, db
+
+with app.app_context():
+    db.create_all()
+
+application = WsgiToAsgi(app)
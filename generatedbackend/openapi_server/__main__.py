@@ -5,13 +5,17 @@ import connexion
 from openapi_server import encoder
 
 
-def main():
+def create_app():
     app = connexion.App(__name__, specification_dir='./openapi/')
     app.app.json_encoder = encoder.JSONEncoder
     app.add_api('openapi.yaml',
                 arguments={'title': 'Library Management API'},
                 pythonic_params=True)
+    return app
+
 
+def main():
+    app = create_app()
     app.run(port=8080)
 
 
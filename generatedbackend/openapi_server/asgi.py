@@ -0,0 +1,16 @@
+"""ASGI entry point.
+
+Lets the Connexion app be served by an ASGI server::
+
+    uvicorn openapi_server.asgi:application --port 8080 --workers 4
+
+WsgiToAsgi runs the app through sync_to_async(thread_sensitive=True), i.e.
+on one thread per worker process, so each worker still handles one request
+at a time: concurrency comes only from the number of workers.
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from openapi_server.__main__ import create_app
+
+application = WsgiToAsgi(create_app().app)
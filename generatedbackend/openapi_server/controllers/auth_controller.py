@@ -1,14 +1,10 @@
-import connexion
 from typing import Dict
 from typing import Tuple
 from typing import Union
 
 from openapi_server.models.error_response import ErrorResponse  # noqa: E501
 from openapi_server.models.get_current_user200_response import GetCurrentUser200Response  # noqa: E501
-from openapi_server.models.login_request import LoginRequest  # noqa: E501
 from openapi_server.models.refresh_token200_response import RefreshToken200Response  # noqa: E501
-from openapi_server.models.refresh_token_request import RefreshTokenRequest  # noqa: E501
-from openapi_server.models.register_request import RegisterRequest  # noqa: E501
 from openapi_server.models.success_response import SuccessResponse  # noqa: E501
 from openapi_server.models.token_response import TokenResponse  # noqa: E501
 from openapi_server.models.verify_token200_response import VerifyToken200Response  # noqa: E501
@@ -23,6 +19,8 @@ def get_current_user():  # noqa: E501
 
     :rtype: Union[GetCurrentUser200Response, Tuple[GetCurrentUser200Response, int], Tuple[GetCurrentUser200Response, int, Dict[str, str]]
     """
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -36,9 +34,8 @@ def login(body):  # noqa: E501
 
     :rtype: Union[TokenResponse, Tuple[TokenResponse, int], Tuple[TokenResponse, int, Dict[str, str]]
     """
-    login_request = body
-    if connexion.request.is_json:
-        login_request = LoginRequest.from_dict(connexion.request.get_json())  # noqa: E501
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -50,6 +47,8 @@ def logout():  # noqa: E501
 
     :rtype: Union[SuccessResponse, Tuple[SuccessResponse, int], Tuple[SuccessResponse, int, Dict[str, str]]
     """
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -63,9 +62,8 @@ def refresh_token(body):  # noqa: E501
 
     :rtype: Union[RefreshToken200Response, Tuple[RefreshToken200Response, int], Tuple[RefreshToken200Response, int, Dict[str, str]]
     """
-    refresh_token_request = body
-    if connexion.request.is_json:
-        refresh_token_request = RefreshTokenRequest.from_dict(connexion.request.get_json())  # noqa: E501
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -79,9 +77,8 @@ def register(body):  # noqa: E501
 
     :rtype: Union[TokenResponse, Tuple[TokenResponse, int], Tuple[TokenResponse, int, Dict[str, str]]
     """
-    register_request = body
-    if connexion.request.is_json:
-        register_request = RegisterRequest.from_dict(connexion.request.get_json())  # noqa: E501
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -93,4 +90,6 @@ def verify_token():  # noqa: E501
 
     :rtype: Union[VerifyToken200Response, Tuple[VerifyToken200Response, int], Tuple[VerifyToken200Response, int, Dict[str, str]]
     """
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
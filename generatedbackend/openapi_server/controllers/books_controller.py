@@ -1,9 +1,7 @@
-import connexion
 from typing import Dict
 from typing import Tuple
 from typing import Union
 
-from openapi_server.models.book_input import BookInput  # noqa: E501
 from openapi_server.models.book_list_response import BookListResponse  # noqa: E501
 from openapi_server.models.create_book201_response import CreateBook201Response  # noqa: E501
 from openapi_server.models.error_response import ErrorResponse  # noqa: E501
@@ -21,9 +19,8 @@ def create_book(body):  # noqa: E501
 
     :rtype: Union[CreateBook201Response, Tuple[CreateBook201Response, int], Tuple[CreateBook201Response, int, Dict[str, str]]
     """
-    book_input = body
-    if connexion.request.is_json:
-        book_input = BookInput.from_dict(connexion.request.get_json())  # noqa: E501
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -37,6 +34,8 @@ def delete_book(book_id):  # noqa: E501
 
     :rtype: Union[SuccessResponse, Tuple[SuccessResponse, int], Tuple[SuccessResponse, int, Dict[str, str]]
     """
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -50,6 +49,8 @@ def get_book_by_id(book_id):  # noqa: E501
 
     :rtype: Union[CreateBook201Response, Tuple[CreateBook201Response, int], Tuple[CreateBook201Response, int, Dict[str, str]]
     """
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -69,6 +70,8 @@ def get_books(page=None, per_page=None, search=None, available_only=None):  # no
 
     :rtype: Union[BookListResponse, Tuple[BookListResponse, int], Tuple[BookListResponse, int, Dict[str, str]]
     """
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -84,7 +87,6 @@ def update_book(book_id, body):  # noqa: E501
 
     :rtype: Union[CreateBook201Response, Tuple[CreateBook201Response, int], Tuple[CreateBook201Response, int, Dict[str, str]]
     """
-    book_input = body
-    if connexion.request.is_json:
-        book_input = BookInput.from_dict(connexion.request.get_json())  # noqa: E501
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
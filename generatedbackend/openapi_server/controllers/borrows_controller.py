@@ -1,12 +1,9 @@
-import connexion
 from typing import Dict
 from typing import Tuple
 from typing import Union
 
 from openapi_server.models.borrow_book201_response import BorrowBook201Response  # noqa: E501
-from openapi_server.models.borrow_input import BorrowInput  # noqa: E501
 from openapi_server.models.error_response import ErrorResponse  # noqa: E501
-from openapi_server.models.extend_input import ExtendInput  # noqa: E501
 from openapi_server.models.get_borrows200_response import GetBorrows200Response  # noqa: E501
 from openapi_server import util
 
@@ -21,9 +18,8 @@ def borrow_book(body):  # noqa: E501
 
     :rtype: Union[BorrowBook201Response, Tuple[BorrowBook201Response, int], Tuple[BorrowBook201Response, int, Dict[str, str]]
     """
-    borrow_input = body
-    if connexion.request.is_json:
-        borrow_input = BorrowInput.from_dict(connexion.request.get_json())  # noqa: E501
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -39,9 +35,8 @@ def extend_borrow(borrow_id, body):  # noqa: E501
 
     :rtype: Union[BorrowBook201Response, Tuple[BorrowBook201Response, int], Tuple[BorrowBook201Response, int, Dict[str, str]]
     """
-    extend_input = body
-    if connexion.request.is_json:
-        extend_input = ExtendInput.from_dict(connexion.request.get_json())  # noqa: E501
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -55,6 +50,8 @@ def get_borrow_by_id(borrow_id):  # noqa: E501
 
     :rtype: Union[BorrowBook201Response, Tuple[BorrowBook201Response, int], Tuple[BorrowBook201Response, int, Dict[str, str]]
     """
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -74,6 +71,8 @@ def get_borrows(page=None, per_page=None, returned=None, overdue_only=None):  #
 
     :rtype: Union[GetBorrows200Response, Tuple[GetBorrows200Response, int], Tuple[GetBorrows200Response, int, Dict[str, str]]
     """
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
 
 
@@ -87,4 +86,6 @@ def return_book(borrow_id):  # noqa: E501
 
     :rtype: Union[BorrowBook201Response, Tuple[BorrowBook201Response, int], Tuple[BorrowBook201Response, int, Dict[str, str]]
     """
+    if not util.impl_ready():
+        return util.NOT_IMPLEMENTED
     return 'do some magic!'
@@ -8,9 +8,15 @@ from openapi_server.encoder import JSONEncoder
 
 class BaseTestCase(TestCase):
 
+    # Parsing the spec and building Connexion's operation map is the slow
+    # part of app setup, so one app is shared by every test in the run
+    _app = None
+
     def create_app(self):
-        logging.getLogger('connexion.operation').setLevel('ERROR')
-        app = connexion.App(__name__, specification_dir='../openapi/')
-        app.app.json_encoder = JSONEncoder
-        app.add_api('openapi.yaml', pythonic_params=True)
-        return app.app
+        if BaseTestCase._app is None:
+            logging.getLogger('connexion.operation').setLevel('ERROR')
+            app = connexion.App(__name__, specification_dir='../openapi/')
+            app.app.json_encoder = JSONEncoder
+            app.add_api('openapi.yaml', pythonic_params=True)
+            BaseTestCase._app = app.app
+        return BaseTestCase._app
@@ -1,8 +1,23 @@
 import datetime
 
 import typing
+from flask import current_app
 from openapi_server import typing_utils
 
+#: Response returned by handlers that are still generated stubs.
+NOT_IMPLEMENTED = ({'success': False, 'message': 'Not implemented'}, 501)
+
+
+def impl_ready():
+    """Whether handler implementations are enabled.
+
+    Stub handlers return :data:`NOT_IMPLEMENTED` before touching the request
+    body until the app config sets ``IMPL_READY``.
+
+    :rtype: bool
+    """
+    return current_app.config.get('IMPL_READY', False)
+
 
 def _deserialize(data, klass):
     """Deserializes dict, list, str into an object.
@@ -11,12 +11,43 @@ Patterns được phân tích:
 5. HATEOAS - Hypermedia as the Engine of Application State
 """
 
-import requests
 import json
+import hmac
+import io
+import sys
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, wraps
+from itertools import islice
 from typing import Dict, List, Any, Optional
 import re
 
+try:
+    import orjson  # faster JSON decoding/encoding when available
+except ImportError:
+    orjson = None
+
+loads = orjson.loads if orjson else json.loads
+
+# Timeout mặc định (giây) cho mỗi request
+REQUEST_TIMEOUT = 10
+
+# Số kết nối keep-alive giữ trong pool (>= số request song song của make_requests)
+POOL_SIZE = 10
+
+# Số items mỗi list request (per_page): chỉ tải đúng số items được hiển thị
+ISSUES_LIMIT = 5
+EVENTS_LIMIT = 5
+PAGINATION_PROBE_LIMIT = 2
+SEARCH_LIMIT = 1
+
+# Link header: <url>; rel="next", <url>; rel="last"
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="([^"]+)"')
+
+# URI Template (RFC 6570) path-segment expression: {/var}
+_URI_TEMPLATE_RE = re.compile(r'\{/(\w+)\}')
+
 # ANSI Colors
 class Colors:
     HEADER = '\033[95m'
@@ -28,18 +59,333 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
     END = '\033[0m'
+    
+    # Thanh ngăn cách của các banner (tính một lần)
+    SEP = '=' * 70
+    HEADER_BAR = BOLD + HEADER + SEP + END
+
+_CRUD_SUMMARY_LINES = (
+    f"\n{Colors.YELLOW}📊 CRUD Pattern Summary:{Colors.END}",
+    "   • CREATE: POST requests để tạo resources mới",
+    "   • READ: GET requests để lấy single resource hoặc collection",
+    "   • UPDATE: PATCH requests cho partial updates (GitHub style)",
+    "   • DELETE: DELETE requests để xóa resources",
+)
+
+def buffered_output(func):
+    """Gom toàn bộ print() của một analyzer và ghi ra stdout một lần"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+def print_banner(color: str, *titles: str):
+    """In banner (thanh ngang, tiêu đề, thanh ngang) bằng một lần print"""
+    bar = Colors.BOLD + color + Colors.SEP + Colors.END
+    lines = [f"{Colors.BOLD}{color}{title}{Colors.END}" for title in titles]
+    print("\n" + "\n".join([bar, *lines, bar]))
+
+def expand_uri_template(template: str, variables: Dict[str, Any]) -> str:
+    """
+    Expand các {/var} trong URI template của GitHub (vd. issues_url)
+    
+    Biến không có trong variables được bỏ qua (expand thành rỗng) như RFC 6570.
+    """
+    return _URI_TEMPLATE_RE.sub(
+        lambda m: f"/{variables[m.group(1)]}" if m.group(1) in variables else "",
+        template
+    )
+
+def verify_webhook_signature(payload: bytes, signature: str, secret: bytes) -> bool:
+    """
+    Verify header X-Hub-Signature-256 của một webhook GitHub
+    
+    hmac.digest tính HMAC-SHA256 one-shot trong OpenSSL; digest 32 bytes
+    được so sánh trực tiếp (constant-time) thay vì ghép chuỗi 'sha256=' + hex.
+    
+    Args:
+        payload: Raw request body
+        signature: Giá trị header, dạng 'sha256=<hex>'
+        secret: Webhook secret
+    """
+    if not signature.startswith("sha256="):
+        return False
+    try:
+        expected = bytes.fromhex(signature[7:])
+    except ValueError:
+        return False
+    return hmac.compare_digest(hmac.digest(secret, payload, "sha256"), expected)
+
+# Webhook API endpoints ({owner}/{repo} được format khi phân tích)
+_WEBHOOK_ENDPOINTS = (
+    {
+        "method": "GET",
+        "endpoint": "/repos/{owner}/{repo}/hooks",
+        "description": "Liệt kê tất cả webhooks của repository"
+    },
+    {
+        "method": "POST",
+        "endpoint": "/repos/{owner}/{repo}/hooks",
+        "description": "Tạo webhook mới",
+        "payload_example": {
+            "name": "web",
+            "active": True,
+            "events": ["push", "pull_request"],
+            "config": {
+                "url": "https://example.com/webhook",
+                "content_type": "json",
+                "secret": "your-secret-key"
+            }
+        }
+    },
+    {
+        "method": "GET",
+        "endpoint": "/repos/{owner}/{repo}/hooks/{{hook_id}}",
+        "description": "Lấy thông tin webhook cụ thể"
+    },
+    {
+        "method": "PATCH",
+        "endpoint": "/repos/{owner}/{repo}/hooks/{{hook_id}}",
+        "description": "Cập nhật webhook"
+    },
+    {
+        "method": "DELETE",
+        "endpoint": "/repos/{owner}/{repo}/hooks/{{hook_id}}",
+        "description": "Xóa webhook"
+    },
+    {
+        "method": "POST",
+        "endpoint": "/repos/{owner}/{repo}/hooks/{{hook_id}}/pings",
+        "description": "Ping webhook để test"
+    }
+)
+
+# Webhook events có thể subscribe
+_WEBHOOK_EVENTS = (
+    ("push", "Khi code được push lên repository"),
+    ("pull_request", "Khi PR được tạo, updated, merged, closed"),
+    ("issues", "Khi issue được tạo, edited, closed"),
+    ("issue_comment", "Khi comment được thêm vào issue/PR"),
+    ("create", "Khi branch hoặc tag được tạo"),
+    ("delete", "Khi branch hoặc tag bị xóa"),
+    ("fork", "Khi repository được fork"),
+    ("star", "Khi repository được starred"),
+    ("watch", "Khi user watch repository"),
+    ("release", "Khi release được published"),
+    ("deployment", "Khi deployment được tạo"),
+    ("deployment_status", "Khi deployment status thay đổi"),
+    ("workflow_run", "Khi GitHub Actions workflow chạy"),
+    ("check_run", "Khi check run được tạo hoặc completed")
+)
+
+# Các loại event trong Events API
+_EVENT_TYPES = (
+    ("PushEvent", "Push commits to branch"),
+    ("PullRequestEvent", "PR opened, closed, merged"),
+    ("IssuesEvent", "Issue opened, closed, edited"),
+    ("IssueCommentEvent", "Comment on issue/PR"),
+    ("CreateEvent", "Branch/tag created"),
+    ("DeleteEvent", "Branch/tag deleted"),
+    ("ForkEvent", "Repository forked"),
+    ("WatchEvent", "Repository starred"),
+    ("ReleaseEvent", "Release published"),
+    ("CommitCommentEvent", "Comment on commit"),
+    ("GollumEvent", "Wiki page created/updated"),
+    ("MemberEvent", "Collaborator added"),
+    ("PublicEvent", "Repository made public")
+)
+
+# Events API endpoints ({owner}/{repo} được format khi phân tích)
+_EVENT_ENDPOINTS = (
+    ("GET", "/events", "Public events across GitHub"),
+    ("GET", "/repos/{owner}/{repo}/events", "Repository events"),
+    ("GET", "/users/{owner}/events", "User's public events"),
+    ("GET", "/users/{owner}/events/public", "User's public events only"),
+    ("GET", "/users/{owner}/received_events", "Events received by user"),
+    ("GET", "/orgs/{{org}}/events", "Organization events"),
+    ("GET", "/networks/{owner}/{repo}/events", "Network events")
+)
+
+@lru_cache(maxsize=128)
+def _webhook_endpoint_table(owner: str, repo: str) -> tuple:
+    """_WEBHOOK_ENDPOINTS đã format cho một repository"""
+    return tuple(
+        {**endpoint, "endpoint": endpoint["endpoint"].format(owner=owner, repo=repo)}
+        for endpoint in _WEBHOOK_ENDPOINTS
+    )
+
+@lru_cache(maxsize=128)
+def _event_endpoint_table(owner: str, repo: str) -> tuple:
+    """_EVENT_ENDPOINTS đã format cho một repository"""
+    return tuple(
+        (method, endpoint.format(owner=owner, repo=repo), description)
+        for method, endpoint, description in _EVENT_ENDPOINTS
+    )
+
+# Nội dung issue được tạo trong CRUD demo mode
+_CRUD_ISSUE_BODY_TEMPLATE = """## 🧪 Demo CRUD Pattern
+
+Đây là issue được tạo tự động bởi **GitHub API Pattern Analyzer** để demo CRUD operations.
+
+### Thông tin:
+- **Thời gian tạo:** {timestamp}
+- **Pattern:** CRUD (Create, Read, Update, Delete)
+- **Method:** POST /repos/{owner}/{repo}/issues
+
+### CRUD Operations sẽ thực hiện:
+1. ✅ **CREATE** - Tạo issue này
+2. ⏳ **READ** - Đọc lại issue vừa tạo
+3. ⏳ **UPDATE** - Cập nhật title và thêm label
+4. ⏳ **CLOSE** - Đóng issue (tương tự DELETE concept)
+
+---
+*Tự động tạo bởi GitHub API Pattern Analyzer*
+"""
+
+# Request bodies mẫu in ra trong CRUD analysis (JSON dựng sẵn)
+_CREATE_BODY_JSON = json.dumps({'title': 'Issue title', 'body': 'Issue description'}, indent=4)
+_UPDATE_BODY_JSON = json.dumps({'title': 'Updated title', 'state': 'closed'}, indent=4)
+_CLOSE_BODY_JSON = json.dumps({'state': 'closed'}, indent=4)
+
+_UPDATE_FOOTER = "\n\n---\n### ✅ UPDATE đã thực hiện!\n- Title đã được cập nhật\n- Issue sẽ được đóng sau đó"
+
+# Ví dụ tĩnh in ra trong các analysis: dựng (và json.dumps) một lần khi import
+_WEBHOOK_PAYLOAD_EXAMPLE = {
+    "ref": "refs/heads/main",
+    "before": "abc123...",
+    "after": "def456...",
+    "repository": {
+        "id": 12345,
+        "name": "repo-name",
+        "full_name": "owner/repo-name"
+    },
+    "pusher": {
+        "name": "username",
+        "email": "user@example.com"
+    },
+    "sender": {
+        "login": "username",
+        "id": 67890,
+        "type": "User"
+    },
+    "commits": [
+        {
+            "id": "commit-sha",
+            "message": "Commit message",
+            "author": {"name": "Author", "email": "author@example.com"}
+        }
+    ]
+}
+_WEBHOOK_PAYLOAD_JSON = json.dumps(_WEBHOOK_PAYLOAD_EXAMPLE, indent=4)
+
+_EVENT_PAYLOAD_EXAMPLE = {
+    "id": "12345678901",
+    "type": "PushEvent",
+    "actor": {
+        "id": 123,
+        "login": "username",
+        "avatar_url": "https://avatars.githubusercontent.com/u/123"
+    },
+    "repo": {
+        "id": 456,
+        "name": "owner/repo",
+        "url": "https://api.github.com/repos/owner/repo"
+    },
+    "payload": {
+        "push_id": 789,
+        "size": 1,
+        "commits": [{"sha": "abc123", "message": "Commit message"}]
+    },
+    "public": True,
+    "created_at": "2025-11-24T12:00:00Z"
+}
+_EVENT_PAYLOAD_JSON = json.dumps(_EVENT_PAYLOAD_EXAMPLE, indent=4)
+
+_SORT_EXAMPLES = (
+    ("Issues", "sort=created|updated|comments", "direction=asc|desc"),
+    ("PRs", "sort=created|updated|popularity|long-running", "direction=asc|desc"),
+    ("Repos", "sort=created|updated|pushed|full_name", "direction=asc|desc"),
+    ("Search", "sort=stars|forks|help-wanted-issues|updated", "order=asc|desc")
+)
+
+_HATEOAS_EXAMPLE_JSON = json.dumps({
+    "id": 12345,
+    "name": "repository-name",
+    "full_name": "owner/repository-name",
+    "html_url": "https://github.com/owner/repository-name",
+    "url": "https://api.github.com/repos/owner/repository-name",
+    "# HATEOAS Links": "---",
+    "forks_url": "https://api.github.com/repos/owner/repo/forks",
+    "keys_url": "https://api.github.com/repos/owner/repo/keys{/key_id}",
+    "collaborators_url": "https://api.github.com/repos/owner/repo/collaborators{/collaborator}",
+    "teams_url": "https://api.github.com/repos/owner/repo/teams",
+    "hooks_url": "https://api.github.com/repos/owner/repo/hooks",
+    "issues_url": "https://api.github.com/repos/owner/repo/issues{/number}",
+    "pulls_url": "https://api.github.com/repos/owner/repo/pulls{/number}",
+    "branches_url": "https://api.github.com/repos/owner/repo/branches{/branch}",
+    "commits_url": "https://api.github.com/repos/owner/repo/commits{/sha}",
+    "# Related Resources": "---",
+    "owner": {
+        "login": "owner",
+        "url": "https://api.github.com/users/owner",
+        "html_url": "https://github.com/owner",
+        "repos_url": "https://api.github.com/users/owner/repos"
+    }
+}, indent=4)
+
+_URI_TEMPLATES = (
+    ("issues_url", "https://api.github.com/repos/owner/repo/issues{/number}"),
+    ("pulls_url", "https://api.github.com/repos/owner/repo/pulls{/number}"),
+    ("branches_url", "https://api.github.com/repos/owner/repo/branches{/branch}"),
+    ("commits_url", "https://api.github.com/repos/owner/repo/commits{/sha}"),
+    ("keys_url", "https://api.github.com/repos/owner/repo/keys{/key_id}")
+)
+
+_NAVIGATION_EXAMPLE = """
+    # Client không cần hardcode URLs, follow links từ response
+    
+    # 1. Bắt đầu từ root
+    response = GET("https://api.github.com")
+    
+    # 2. Follow link đến user
+    user_url = response["current_user_url"]
+    user = GET(user_url)
+    
+    # 3. Follow link đến repos
+    repos_url = user["repos_url"]
+    repos = GET(repos_url)
+    
+    # 4. Follow link đến specific repo
+    repo = repos[0]
+    issues_url = repo["issues_url"].replace("{/number}", "")
+    issues = GET(issues_url)
+    
+    # 5. Follow link đến specific issue
+    issue = issues[0]
+    comments_url = issue["comments_url"]
+    comments = GET(comments_url)
+    """
 
 class GitHubAPIAnalyzer:
     """Phân tích GitHub API để tìm các REST patterns"""
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, output_path: Optional[str] = None):
         """
         Khởi tạo analyzer
         
         Args:
             token: GitHub Personal Access Token (optional, tăng rate limit)
+            output_path: File NDJSON (optional); mỗi analyzer chạy xong ghi
+                thêm một dòng {"pattern": ..., "data": ...}
         """
         self.base_url = "https://api.github.com"
+        self.output_path = output_path
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "GitHub-API-Pattern-Analyzer"
@@ -47,6 +393,16 @@ class GitHubAPIAnalyzer:
         if token:
             self.headers["Authorization"] = f"token {token}"
         
+        # Session tạo khi request đầu tiên (xem property session)
+        self._session = None
+        
+        # ETag cache cho GET: key -> (etag, headers, data)
+        # Request có If-None-Match trả về 304 (không tính vào rate limit)
+        self._etag_cache = {}
+        
+        # Memo GET responses trong một lần run_full_analysis (None: tắt)
+        self._run_cache = None
+        
         self.analysis_results = {
             "crud": [],
             "webhook": [],
@@ -55,23 +411,138 @@ class GitHubAPIAnalyzer:
             "hateoas": []
         }
     
+    @property
+    def session(self):
+        """
+        Một Session dùng chung: giữ kết nối keep-alive tới api.github.com
+        
+        requests chỉ được import ở đây, nên import module này vẫn nhẹ khi
+        không gọi API.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+            # Thử lại lỗi tạm thời của GitHub (chỉ với method idempotent)
+            retry = Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=(502, 503, 504), raise_on_status=False)
+            self._session.mount("https://", HTTPAdapter(pool_maxsize=POOL_SIZE, max_retries=retry))
+        return self._session
+    
+    def close(self):
+        """Đóng các kết nối của Session (nếu đã tạo)"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict]) -> str:
+        return f"{url} {sorted((params or {}).items())}"
+    
     def make_request(self, endpoint: str, method: str = "GET", **kwargs) -> Dict:
-        """Thực hiện API request và trả về response với metadata"""
-        url = f"{self.base_url}{endpoint}"
+        """
+        Thực hiện API request và trả về response với metadata
+        
+        GET requests dùng conditional request (If-None-Match): nếu resource
+        không đổi, GitHub trả 304 và response đã cache được dùng lại.
+        Trong run_full_analysis, mỗi GET chỉ được gửi một lần.
+        """
+        url = self.base_url + endpoint
+        if method != "GET" or self._run_cache is None:
+            return self._send(url, method, **kwargs)
+        
+        key = self._cache_key(url, kwargs.get("params"))
+        response = self._run_cache.get(key)
+        if response is None:
+            response = self._send(url, method, **kwargs)
+            if "error" not in response:
+                self._run_cache[key] = response
+        return response
+    
+    def _send(self, url: str, method: str, **kwargs) -> Dict:
+        """Gửi request; GET được revalidate bằng ETag cache"""
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        cache_key = None
+        cached = None
+        if method == "GET":
+            cache_key = self._cache_key(url, kwargs.get("params"))
+            cached = self._etag_cache.get(cache_key)
+            if cached:
+                kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": cached[0]}
         try:
-            response = requests.request(method, url, headers=self.headers, **kwargs)
-            return {
+            response = self.session.request(method, url, **kwargs)
+            if cached and response.status_code == 304:
+                etag, headers, data = cached
+                headers = headers.copy()
+                headers.update(response.headers)
+                return {
+                    "status_code": 200,
+                    "headers": headers,
+                    "data": data,
+                    "url": url,
+                    "method": method,
+                    "not_modified": True
+                }
+            result = {
                 "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "data": response.json() if response.content else {},
+                "headers": response.headers,
+                "data": loads(response.content) if response.content else {},
                 "url": url,
                 "method": method
             }
+            etag = response.headers.get("ETag")
+            if cache_key and etag and response.status_code == 200:
+                self._etag_cache[cache_key] = (etag, result["headers"], result["data"])
+            return result
         except Exception as e:
             return {"error": str(e), "url": url, "method": method}
     
+    def make_requests(self, *calls) -> List[Dict]:
+        """
+        Thực hiện song song nhiều GET requests độc lập
+        
+        Args:
+            calls: các tuple (endpoint, params)
+            
+        Returns:
+            List responses (cùng dạng make_request), đúng thứ tự calls
+        """
+        self.session  # tạo Session trước khi chia thread
+        with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+            futures = [pool.submit(self.make_request, endpoint, params=params)
+                       for endpoint, params in calls]
+            return [future.result() for future in futures]
+    
+    def save_results(self, filename: str):
+        """Lưu analysis_results ra file JSON (indent 2, giữ nguyên Unicode)"""
+        if orjson:
+            # orjson trả về cả chuỗi một lần -> encode từng key top-level để
+            # bộ nhớ đỉnh chỉ cỡ value lớn nhất (output giống hệt dumps cả dict)
+            with open(filename, 'wb') as f:
+                f.write(b"{")
+                for i, (key, value) in enumerate(self.analysis_results.items()):
+                    encoded = orjson.dumps(value, default=str, option=orjson.OPT_INDENT_2)
+                    f.write((b",\n  " if i else b"\n  ") + orjson.dumps(key) + b": ")
+                    f.write(encoded.replace(b"\n", b"\n  "))
+                f.write(b"\n}" if self.analysis_results else b"}")
+        else:
+            # json.dump encode dần (iterencode) và ghi từng đoạn, không dựng cả chuỗi
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.analysis_results, f, indent=2, ensure_ascii=False, default=str)
+    
+    def _store_result(self, pattern: str, data):
+        """Lưu kết quả của một analyzer; ghi thêm vào output_path nếu có"""
+        self.analysis_results[pattern] = data
+        if self.output_path:
+            line = json.dumps({"pattern": pattern, "data": data}, ensure_ascii=False, default=str)
+            with open(self.output_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+    
     # ==================== CRUD Pattern Analysis ====================
     
+    @buffered_output
     def analyze_crud_pattern(self, owner: str, repo: str, demo_mode: bool = False) -> Dict:
         """
         Phân tích CRUD pattern qua Repository API
@@ -87,16 +558,19 @@ class GitHubAPIAnalyzer:
             repo: Repository name
             demo_mode: Nếu True, sẽ thực sự tạo/update/close issue trên GitHub
         """
-        print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.BLUE}1. CRUD PATTERN ANALYSIS{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.END}")
+        print_banner(Colors.BLUE, "1. CRUD PATTERN ANALYSIS")
         
         crud_examples = []
         created_issue_number = None
         
+        # Hai READ độc lập -> gửi song song
+        repo_response, issues_response = self.make_requests(
+            (f"/repos/{owner}/{repo}", None),
+            (f"/repos/{owner}/{repo}/issues", {"per_page": ISSUES_LIMIT})
+        )
+        
         # READ - Get repository info
         print(f"\n{Colors.CYAN}📖 READ Operation:{Colors.END}")
-        repo_response = self.make_request(f"/repos/{owner}/{repo}")
         if "error" not in repo_response:
             print(f"   GET /repos/{owner}/{repo}")
             print(f"   Status: {Colors.GREEN}{repo_response['status_code']}{Colors.END}")
@@ -105,12 +579,11 @@ class GitHubAPIAnalyzer:
                 "method": "GET",
                 "endpoint": f"/repos/{owner}/{repo}",
                 "description": "Lấy thông tin repository",
-                "response_fields": list(repo_response['data'].keys())[:10]
+                "response_fields": list(islice(repo_response['data'], 10))
             })
         
         # READ - List issues (Collection)
         print(f"\n{Colors.CYAN}📖 READ Collection:{Colors.END}")
-        issues_response = self.make_request(f"/repos/{owner}/{repo}/issues", params={"per_page": 5})
         if "error" not in issues_response:
             print(f"   GET /repos/{owner}/{repo}/issues")
             print(f"   Status: {Colors.GREEN}{issues_response['status_code']}{Colors.END}")
@@ -120,7 +593,7 @@ class GitHubAPIAnalyzer:
                 "method": "GET",
                 "endpoint": f"/repos/{owner}/{repo}/issues",
                 "description": "Liệt kê issues của repository",
-                "pagination": "Link header" in str(issues_response['headers'])
+                "pagination": "Link" in issues_response['headers']
             })
         
         # ========== DEMO MODE: Thực sự tạo issue trên GitHub ==========
@@ -132,24 +605,7 @@ class GitHubAPIAnalyzer:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             issue_data = {
                 "title": f"[API Demo] CRUD Pattern Test - {timestamp}",
-                "body": f"""## 🧪 Demo CRUD Pattern
-
-Đây là issue được tạo tự động bởi **GitHub API Pattern Analyzer** để demo CRUD operations.
-
-### Thông tin:
-- **Thời gian tạo:** {timestamp}
-- **Pattern:** CRUD (Create, Read, Update, Delete)
-- **Method:** POST /repos/{owner}/{repo}/issues
-
-### CRUD Operations sẽ thực hiện:
-1. ✅ **CREATE** - Tạo issue này
-2. ⏳ **READ** - Đọc lại issue vừa tạo
-3. ⏳ **UPDATE** - Cập nhật title và thêm label
-4. ⏳ **CLOSE** - Đóng issue (tương tự DELETE concept)
-
----
-*Tự động tạo bởi GitHub API Pattern Analyzer*
-""",
+                "body": _CRUD_ISSUE_BODY_TEMPLATE.format(timestamp=timestamp, owner=owner, repo=repo),
                 "labels": ["api-demo", "automated"]
             }
             
@@ -198,7 +654,7 @@ class GitHubAPIAnalyzer:
                 print(f"\n{Colors.CYAN}🔄 UPDATE Operation (REAL):{Colors.END}")
                 update_data = {
                     "title": f"[API Demo] ✅ CRUD Test Completed - {timestamp}",
-                    "body": create_response["data"]["body"] + "\n\n---\n### ✅ UPDATE đã thực hiện!\n- Title đã được cập nhật\n- Issue sẽ được đóng sau đó"
+                    "body": issue_data["body"] + _UPDATE_FOOTER
                 }
                 print(f"   PATCH /repos/{owner}/{repo}/issues/{created_issue_number}")
                 
@@ -223,7 +679,7 @@ class GitHubAPIAnalyzer:
                 # CLOSE (DELETE equivalent) - Đóng issue
                 print(f"\n{Colors.CYAN}🗑️ CLOSE/DELETE Operation (REAL):{Colors.END}")
                 print(f"   PATCH /repos/{owner}/{repo}/issues/{created_issue_number}")
-                print(f"   Body: {json.dumps({'state': 'closed'}, indent=4)}")
+                print(f"   Body: {_CLOSE_BODY_JSON}")
                 
                 close_response = self.make_request(
                     f"/repos/{owner}/{repo}/issues/{created_issue_number}",
@@ -254,7 +710,7 @@ class GitHubAPIAnalyzer:
             # Non-demo mode: Chỉ hiển thị structure
             print(f"\n{Colors.CYAN}✏️ CREATE Operation (Structure):{Colors.END}")
             print(f"   POST /repos/{owner}/{repo}/issues")
-            print(f"   Body: {json.dumps({'title': 'Issue title', 'body': 'Issue description'}, indent=4)}")
+            print(f"   Body: {_CREATE_BODY_JSON}")
             crud_examples.append({
                 "operation": "CREATE",
                 "method": "POST",
@@ -267,7 +723,7 @@ class GitHubAPIAnalyzer:
             # UPDATE - Example structure
             print(f"\n{Colors.CYAN}🔄 UPDATE Operation (Structure):{Colors.END}")
             print(f"   PATCH /repos/{owner}/{repo}/issues/{{issue_number}}")
-            print(f"   Body: {json.dumps({'title': 'Updated title', 'state': 'closed'}, indent=4)}")
+            print(f"   Body: {_UPDATE_BODY_JSON}")
             crud_examples.append({
                 "operation": "UPDATE",
                 "method": "PATCH",
@@ -279,7 +735,7 @@ class GitHubAPIAnalyzer:
             # DELETE - Example structure
             print(f"\n{Colors.CYAN}🗑️ DELETE/CLOSE Operation (Structure):{Colors.END}")
             print(f"   PATCH /repos/{owner}/{repo}/issues/{{issue_number}}")
-            print(f"   Body: {json.dumps({'state': 'closed'}, indent=4)}")
+            print(f"   Body: {_CLOSE_BODY_JSON}")
             crud_examples.append({
                 "operation": "CLOSE (DELETE equivalent)",
                 "method": "PATCH",
@@ -290,76 +746,31 @@ class GitHubAPIAnalyzer:
             
             print(f"\n{Colors.YELLOW}💡 Tip: Chọn option [1a] từ menu để chạy CRUD demo thật!{Colors.END}")
         
-        self.analysis_results["crud"] = crud_examples
+        self._store_result("crud", crud_examples)
         
         # Summary
-        print(f"\n{Colors.YELLOW}📊 CRUD Pattern Summary:{Colors.END}")
-        print(f"   • CREATE: POST requests để tạo resources mới")
-        print(f"   • READ: GET requests để lấy single resource hoặc collection")
-        print(f"   • UPDATE: PATCH requests cho partial updates (GitHub style)")
-        print(f"   • DELETE: DELETE requests để xóa resources")
+        for line in _CRUD_SUMMARY_LINES:
+            print(line)
         
         return {"crud_examples": crud_examples}
     
     # ==================== Webhook Pattern Analysis ====================
     
+    @buffered_output
     def analyze_webhook_pattern(self, owner: str, repo: str) -> Dict:
         """
         Phân tích Webhook pattern trong GitHub API
         
         Webhooks cho phép nhận thông báo real-time khi events xảy ra
         """
-        print(f"\n{Colors.BOLD}{Colors.GREEN}{'='*70}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.GREEN}2. WEBHOOK PATTERN ANALYSIS{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.GREEN}{'='*70}{Colors.END}")
+        print_banner(Colors.GREEN, "2. WEBHOOK PATTERN ANALYSIS")
         
         webhook_info = []
         
         # List webhooks (requires authentication)
         print(f"\n{Colors.CYAN}📡 Webhook Endpoints:{Colors.END}")
         
-        webhook_endpoints = [
-            {
-                "method": "GET",
-                "endpoint": f"/repos/{owner}/{repo}/hooks",
-                "description": "Liệt kê tất cả webhooks của repository"
-            },
-            {
-                "method": "POST",
-                "endpoint": f"/repos/{owner}/{repo}/hooks",
-                "description": "Tạo webhook mới",
-                "payload_example": {
-                    "name": "web",
-                    "active": True,
-                    "events": ["push", "pull_request"],
-                    "config": {
-                        "url": "https://example.com/webhook",
-                        "content_type": "json",
-                        "secret": "your-secret-key"
-                    }
-                }
-            },
-            {
-                "method": "GET",
-                "endpoint": f"/repos/{owner}/{repo}/hooks/{{hook_id}}",
-                "description": "Lấy thông tin webhook cụ thể"
-            },
-            {
-                "method": "PATCH",
-                "endpoint": f"/repos/{owner}/{repo}/hooks/{{hook_id}}",
-                "description": "Cập nhật webhook"
-            },
-            {
-                "method": "DELETE",
-                "endpoint": f"/repos/{owner}/{repo}/hooks/{{hook_id}}",
-                "description": "Xóa webhook"
-            },
-            {
-                "method": "POST",
-                "endpoint": f"/repos/{owner}/{repo}/hooks/{{hook_id}}/pings",
-                "description": "Ping webhook để test"
-            }
-        ]
+        webhook_endpoints = _webhook_endpoint_table(owner, repo)
         
         for endpoint in webhook_endpoints:
             print(f"   {endpoint['method']:6} {endpoint['endpoint']}")
@@ -368,61 +779,18 @@ class GitHubAPIAnalyzer:
         
         # Webhook Events
         print(f"\n{Colors.CYAN}🎯 Available Webhook Events:{Colors.END}")
-        webhook_events = [
-            ("push", "Khi code được push lên repository"),
-            ("pull_request", "Khi PR được tạo, updated, merged, closed"),
-            ("issues", "Khi issue được tạo, edited, closed"),
-            ("issue_comment", "Khi comment được thêm vào issue/PR"),
-            ("create", "Khi branch hoặc tag được tạo"),
-            ("delete", "Khi branch hoặc tag bị xóa"),
-            ("fork", "Khi repository được fork"),
-            ("star", "Khi repository được starred"),
-            ("watch", "Khi user watch repository"),
-            ("release", "Khi release được published"),
-            ("deployment", "Khi deployment được tạo"),
-            ("deployment_status", "Khi deployment status thay đổi"),
-            ("workflow_run", "Khi GitHub Actions workflow chạy"),
-            ("check_run", "Khi check run được tạo hoặc completed")
-        ]
-        
-        for event, description in webhook_events:
+        for event, description in _WEBHOOK_EVENTS:
             print(f"   • {Colors.YELLOW}{event:20}{Colors.END} - {description}")
         
         # Webhook Payload Structure
         print(f"\n{Colors.CYAN}📦 Webhook Payload Structure Example (push event):{Colors.END}")
-        webhook_payload_example = {
-            "ref": "refs/heads/main",
-            "before": "abc123...",
-            "after": "def456...",
-            "repository": {
-                "id": 12345,
-                "name": "repo-name",
-                "full_name": "owner/repo-name"
-            },
-            "pusher": {
-                "name": "username",
-                "email": "user@example.com"
-            },
-            "sender": {
-                "login": "username",
-                "id": 67890,
-                "type": "User"
-            },
-            "commits": [
-                {
-                    "id": "commit-sha",
-                    "message": "Commit message",
-                    "author": {"name": "Author", "email": "author@example.com"}
-                }
-            ]
-        }
-        print(json.dumps(webhook_payload_example, indent=4))
+        print(_WEBHOOK_PAYLOAD_JSON)
         
         # Webhook Security
         print(f"\n{Colors.CYAN}🔐 Webhook Security:{Colors.END}")
         print(f"   • Secret: Dùng HMAC-SHA256 để verify payload")
         print(f"   • Header: X-Hub-Signature-256 chứa signature")
-        print(f"   • Verification Code Example:")
+        print(f"   • Verification Code Example (bản dùng thật: verify_webhook_signature trong module này):")
         verification_code = '''
     import hmac
     import hashlib
@@ -437,31 +805,30 @@ class GitHubAPIAnalyzer:
     '''
         print(verification_code)
         
-        self.analysis_results["webhook"] = {
+        self._store_result("webhook", {
             "endpoints": webhook_endpoints,
-            "events": webhook_events,
-            "payload_example": webhook_payload_example
-        }
+            "events": _WEBHOOK_EVENTS,
+            "payload_example": _WEBHOOK_PAYLOAD_EXAMPLE
+        })
         
         return self.analysis_results["webhook"]
     
     # ==================== Event-Driven Pattern Analysis ====================
     
+    @buffered_output
     def analyze_event_driven_pattern(self, owner: str, repo: str) -> Dict:
         """
         Phân tích Event-driven pattern trong GitHub API
         
         GitHub sử dụng events để track tất cả hoạt động
         """
-        print(f"\n{Colors.BOLD}{Colors.YELLOW}{'='*70}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.YELLOW}3. EVENT-DRIVEN PATTERN ANALYSIS{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.YELLOW}{'='*70}{Colors.END}")
+        print_banner(Colors.YELLOW, "3. EVENT-DRIVEN PATTERN ANALYSIS")
         
         event_info = []
         
         # Get repository events
         print(f"\n{Colors.CYAN}📅 Repository Events:{Colors.END}")
-        events_response = self.make_request(f"/repos/{owner}/{repo}/events", params={"per_page": 5})
+        events_response = self.make_request(f"/repos/{owner}/{repo}/events", params={"per_page": EVENTS_LIMIT})
         
         if "error" not in events_response and events_response["status_code"] == 200:
             print(f"   GET /repos/{owner}/{repo}/events")
@@ -469,7 +836,7 @@ class GitHubAPIAnalyzer:
             
             if events_response["data"]:
                 print(f"\n   {Colors.CYAN}Recent Events:{Colors.END}")
-                for event in events_response["data"][:5]:
+                for event in events_response["data"]:
                     event_type = event.get("type", "Unknown")
                     actor = event.get("actor", {}).get("login", "Unknown")
                     created_at = event.get("created_at", "")
@@ -482,36 +849,12 @@ class GitHubAPIAnalyzer:
         
         # Event Types
         print(f"\n{Colors.CYAN}🎭 GitHub Event Types:{Colors.END}")
-        event_types = [
-            ("PushEvent", "Push commits to branch"),
-            ("PullRequestEvent", "PR opened, closed, merged"),
-            ("IssuesEvent", "Issue opened, closed, edited"),
-            ("IssueCommentEvent", "Comment on issue/PR"),
-            ("CreateEvent", "Branch/tag created"),
-            ("DeleteEvent", "Branch/tag deleted"),
-            ("ForkEvent", "Repository forked"),
-            ("WatchEvent", "Repository starred"),
-            ("ReleaseEvent", "Release published"),
-            ("CommitCommentEvent", "Comment on commit"),
-            ("GollumEvent", "Wiki page created/updated"),
-            ("MemberEvent", "Collaborator added"),
-            ("PublicEvent", "Repository made public")
-        ]
-        
-        for event_type, description in event_types:
+        for event_type, description in _EVENT_TYPES:
             print(f"   • {Colors.GREEN}{event_type:25}{Colors.END} - {description}")
         
         # Event API Endpoints
         print(f"\n{Colors.CYAN}📡 Event API Endpoints:{Colors.END}")
-        event_endpoints = [
-            ("GET", "/events", "Public events across GitHub"),
-            ("GET", f"/repos/{owner}/{repo}/events", "Repository events"),
-            ("GET", f"/users/{owner}/events", "User's public events"),
-            ("GET", f"/users/{owner}/events/public", "User's public events only"),
-            ("GET", f"/users/{owner}/received_events", "Events received by user"),
-            ("GET", f"/orgs/{{org}}/events", "Organization events"),
-            ("GET", f"/networks/{owner}/{repo}/events", "Network events")
-        ]
+        event_endpoints = _event_endpoint_table(owner, repo)
         
         for method, endpoint, description in event_endpoints:
             print(f"   {method:4} {endpoint}")
@@ -519,28 +862,7 @@ class GitHubAPIAnalyzer:
         
         # Event Payload Structure
         print(f"\n{Colors.CYAN}📦 Event Payload Structure:{Colors.END}")
-        event_payload_example = {
-            "id": "12345678901",
-            "type": "PushEvent",
-            "actor": {
-                "id": 123,
-                "login": "username",
-                "avatar_url": "https://avatars.githubusercontent.com/u/123"
-            },
-            "repo": {
-                "id": 456,
-                "name": "owner/repo",
-                "url": "https://api.github.com/repos/owner/repo"
-            },
-            "payload": {
-                "push_id": 789,
-                "size": 1,
-                "commits": [{"sha": "abc123", "message": "Commit message"}]
-            },
-            "public": True,
-            "created_at": "2025-11-24T12:00:00Z"
-        }
-        print(json.dumps(event_payload_example, indent=4))
+        print(_EVENT_PAYLOAD_JSON)
         
         # Event-driven Architecture Benefits
         print(f"\n{Colors.CYAN}✅ Event-driven Benefits in GitHub API:{Colors.END}")
@@ -550,28 +872,33 @@ class GitHubAPIAnalyzer:
         print(f"   • Analytics: Phân tích patterns sử dụng")
         print(f"   • Decoupling: Services có thể react độc lập với events")
         
-        self.analysis_results["event_driven"] = {
+        self._store_result("event_driven", {
             "recent_events": event_info,
-            "event_types": event_types,
+            "event_types": _EVENT_TYPES,
             "endpoints": event_endpoints
-        }
+        })
         
         return self.analysis_results["event_driven"]
     
     # ==================== Query Pattern Analysis ====================
     
+    @buffered_output
     def analyze_query_pattern(self, owner: str, repo: str) -> Dict:
         """
         Phân tích Query pattern trong GitHub API
         
         GitHub cung cấp powerful query parameters cho filtering, pagination, sorting
         """
-        print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.CYAN}4. QUERY PATTERN ANALYSIS{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.END}")
+        print_banner(Colors.CYAN, "4. QUERY PATTERN ANALYSIS")
         
         query_info = []
         
+        # Pagination probe và search demo độc lập -> gửi song song
+        issues_response, search_response = self.make_requests(
+            (f"/repos/{owner}/{repo}/issues", {"per_page": PAGINATION_PROBE_LIMIT}),
+            ("/search/repositories", {"q": f"repo:{owner}/{repo}", "per_page": SEARCH_LIMIT})
+        )
+        
         # Pagination
         print(f"\n{Colors.CYAN}📄 Pagination Parameters:{Colors.END}")
         pagination_params = [
@@ -585,7 +912,6 @@ class GitHubAPIAnalyzer:
         
         # Demo pagination with Link header
         print(f"\n{Colors.CYAN}🔗 Link Header Pagination:{Colors.END}")
-        issues_response = self.make_request(f"/repos/{owner}/{repo}/issues", params={"per_page": 2})
         if "error" not in issues_response:
             link_header = issues_response["headers"].get("Link", "")
             if link_header:
@@ -669,10 +995,6 @@ class GitHubAPIAnalyzer:
         
         # Demo search
         print(f"\n{Colors.CYAN}📊 Search Demo:{Colors.END}")
-        search_response = self.make_request("/search/repositories", params={
-            "q": f"repo:{owner}/{repo}",
-            "per_page": 1
-        })
         if "error" not in search_response and search_response["status_code"] == 200:
             print(f"   Search: repo:{owner}/{repo}")
             data = search_response["data"]
@@ -684,35 +1006,25 @@ class GitHubAPIAnalyzer:
         
         # Sorting
         print(f"\n{Colors.CYAN}📈 Sorting Parameters:{Colors.END}")
-        sort_examples = [
-            ("Issues", "sort=created|updated|comments", "direction=asc|desc"),
-            ("PRs", "sort=created|updated|popularity|long-running", "direction=asc|desc"),
-            ("Repos", "sort=created|updated|pushed|full_name", "direction=asc|desc"),
-            ("Search", "sort=stars|forks|help-wanted-issues|updated", "order=asc|desc")
-        ]
-        for resource, sort_values, direction in sort_examples:
+        for resource, sort_values, direction in _SORT_EXAMPLES:
             print(f"   • {Colors.YELLOW}{resource:10}{Colors.END} {sort_values} | {direction}")
         
-        self.analysis_results["query"] = {
+        self._store_result("query", {
             "pagination": pagination_params,
             "filtering": filter_examples,
             "search": search_examples,
-            "sorting": sort_examples
-        }
+            "sorting": list(_SORT_EXAMPLES)
+        })
         
         return self.analysis_results["query"]
     
     def _parse_link_header(self, link_header: str) -> Dict[str, str]:
         """Parse Link header để extract pagination URLs"""
-        links = {}
-        for part in link_header.split(","):
-            match = re.match(r'<([^>]+)>;\s*rel="([^"]+)"', part.strip())
-            if match:
-                links[match.group(2)] = match.group(1)
-        return links
+        return {match.group(2): match.group(1) for match in _LINK_RE.finditer(link_header)}
     
     # ==================== HATEOAS Pattern Analysis ====================
     
+    @buffered_output
     def analyze_hateoas_pattern(self, owner: str, repo: str) -> Dict:
         """
         Phân tích HATEOAS pattern trong GitHub API
@@ -720,102 +1032,49 @@ class GitHubAPIAnalyzer:
         HATEOAS = Hypermedia as the Engine of Application State
         API trả về links để navigate đến related resources
         """
-        print(f"\n{Colors.BOLD}{Colors.RED}{'='*70}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.RED}5. HATEOAS PATTERN ANALYSIS{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.RED}{'='*70}{Colors.END}")
+        print_banner(Colors.RED, "5. HATEOAS PATTERN ANALYSIS")
         
         hateoas_info = []
         
+        # Repository và root endpoint độc lập -> gửi song song
+        repo_response, root_response = self.make_requests(
+            (f"/repos/{owner}/{repo}", None),
+            ("", None)
+        )
+        
         # Get repository to show HATEOAS links
         print(f"\n{Colors.CYAN}🔗 HATEOAS in Repository Response:{Colors.END}")
-        repo_response = self.make_request(f"/repos/{owner}/{repo}")
         
         if "error" not in repo_response and repo_response["status_code"] == 200:
             data = repo_response["data"]
             
             # Extract all _url fields (HATEOAS links)
             print(f"\n   {Colors.GREEN}Hypermedia Links trong response:{Colors.END}")
-            url_fields = {k: v for k, v in data.items() if k.endswith("_url") and v}
+            url_fields = ((k, v) for k, v in data.items() if k.endswith("_url") and v)
             
-            for key, url in list(url_fields.items())[:15]:
+            for key, url in islice(url_fields, 15):
                 print(f"   • {Colors.YELLOW}{key:30}{Colors.END}")
                 print(f"     {url[:70]}...")
                 hateoas_info.append({"field": key, "url": url})
         
         # Show HATEOAS structure
         print(f"\n{Colors.CYAN}📋 HATEOAS Response Structure:{Colors.END}")
-        hateoas_example = {
-            "id": 12345,
-            "name": "repository-name",
-            "full_name": "owner/repository-name",
-            "html_url": "https://github.com/owner/repository-name",
-            "url": "https://api.github.com/repos/owner/repository-name",
-            "# HATEOAS Links": "---",
-            "forks_url": "https://api.github.com/repos/owner/repo/forks",
-            "keys_url": "https://api.github.com/repos/owner/repo/keys{/key_id}",
-            "collaborators_url": "https://api.github.com/repos/owner/repo/collaborators{/collaborator}",
-            "teams_url": "https://api.github.com/repos/owner/repo/teams",
-            "hooks_url": "https://api.github.com/repos/owner/repo/hooks",
-            "issues_url": "https://api.github.com/repos/owner/repo/issues{/number}",
-            "pulls_url": "https://api.github.com/repos/owner/repo/pulls{/number}",
-            "branches_url": "https://api.github.com/repos/owner/repo/branches{/branch}",
-            "commits_url": "https://api.github.com/repos/owner/repo/commits{/sha}",
-            "# Related Resources": "---",
-            "owner": {
-                "login": "owner",
-                "url": "https://api.github.com/users/owner",
-                "html_url": "https://github.com/owner",
-                "repos_url": "https://api.github.com/users/owner/repos"
-            }
-        }
-        print(json.dumps(hateoas_example, indent=4))
+        print(_HATEOAS_EXAMPLE_JSON)
         
         # URI Templates
         print(f"\n{Colors.CYAN}📝 URI Templates (RFC 6570):{Colors.END}")
-        uri_templates = [
-            ("issues_url", "https://api.github.com/repos/owner/repo/issues{/number}"),
-            ("pulls_url", "https://api.github.com/repos/owner/repo/pulls{/number}"),
-            ("branches_url", "https://api.github.com/repos/owner/repo/branches{/branch}"),
-            ("commits_url", "https://api.github.com/repos/owner/repo/commits{/sha}"),
-            ("keys_url", "https://api.github.com/repos/owner/repo/keys{/key_id}")
-        ]
-        
         print(f"\n   GitHub sử dụng URI Templates theo RFC 6570:")
-        for name, template in uri_templates:
+        for name, template in _URI_TEMPLATES:
             print(f"   • {Colors.YELLOW}{name}{Colors.END}")
             print(f"     Template: {template}")
             # Show how to expand
             if "{/number}" in template:
-                expanded = template.replace("{/number}", "/42")
+                expanded = expand_uri_template(template, {"number": 42})
                 print(f"     Expanded: {expanded}")
         
         # HATEOAS Navigation
         print(f"\n{Colors.CYAN}🧭 HATEOAS Navigation Example:{Colors.END}")
-        navigation_example = """
-    # Client không cần hardcode URLs, follow links từ response
-    
-    # 1. Bắt đầu từ root
-    response = GET("https://api.github.com")
-    
-    # 2. Follow link đến user
-    user_url = response["current_user_url"]
-    user = GET(user_url)
-    
-    # 3. Follow link đến repos
-    repos_url = user["repos_url"]
-    repos = GET(repos_url)
-    
-    # 4. Follow link đến specific repo
-    repo = repos[0]
-    issues_url = repo["issues_url"].replace("{/number}", "")
-    issues = GET(issues_url)
-    
-    # 5. Follow link đến specific issue
-    issue = issues[0]
-    comments_url = issue["comments_url"]
-    comments = GET(comments_url)
-    """
-        print(navigation_example)
+        print(_NAVIGATION_EXAMPLE)
         
         # Benefits
         print(f"\n{Colors.CYAN}✅ HATEOAS Benefits:{Colors.END}")
@@ -827,18 +1086,17 @@ class GitHubAPIAnalyzer:
         
         # Root API endpoint
         print(f"\n{Colors.CYAN}🌐 Root API Endpoint (Entry Point):{Colors.END}")
-        root_response = self.make_request("")
         if "error" not in root_response and root_response["status_code"] == 200:
             print(f"   GET https://api.github.com/")
             print(f"\n   Available endpoints (HATEOAS links):")
-            for key, url in list(root_response["data"].items())[:10]:
+            for key, url in islice(root_response["data"].items(), 10):
                 print(f"   • {Colors.YELLOW}{key:30}{Colors.END} → {url[:50]}...")
         
-        self.analysis_results["hateoas"] = {
+        self._store_result("hateoas", {
             "url_fields": hateoas_info,
-            "uri_templates": uri_templates,
-            "navigation_example": navigation_example
-        }
+            "uri_templates": list(_URI_TEMPLATES),
+            "navigation_example": _NAVIGATION_EXAMPLE
+        })
         
         return self.analysis_results["hateoas"]
     
@@ -855,36 +1113,53 @@ class GitHubAPIAnalyzer:
         Returns:
             Dictionary chứa tất cả analysis results
         """
-        print(f"\n{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.HEADER}   GITHUB API PATTERN ANALYSIS{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.HEADER}   Repository: {owner}/{repo}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.HEADER}   Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.END}")
-        
-        # Check rate limit
-        rate_limit = self.make_request("/rate_limit")
-        if "error" not in rate_limit:
-            core = rate_limit["data"].get("resources", {}).get("core", {})
-            print(f"\n{Colors.CYAN}📊 Rate Limit:{Colors.END}")
-            print(f"   Remaining: {core.get('remaining', 'N/A')}/{core.get('limit', 'N/A')}")
-        
-        # Run all analyses
-        self.analyze_crud_pattern(owner, repo)
-        self.analyze_webhook_pattern(owner, repo)
-        self.analyze_event_driven_pattern(owner, repo)
-        self.analyze_query_pattern(owner, repo)
-        self.analyze_hateoas_pattern(owner, repo)
+        print_banner(
+            Colors.HEADER,
+            "   GITHUB API PATTERN ANALYSIS",
+            f"   Repository: {owner}/{repo}",
+            f"   Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        )
+        
+        # Các analyzer không phụ thuộc dữ liệu của nhau: tải song song mọi
+        # GET chúng cần vào memo của lần chạy, sau đó in kết quả tuần tự;
+        # GET trùng nhau giữa các analyzer (repo, ...) chỉ gửi một lần
+        self._run_cache = {}
+        try:
+            self.make_requests(
+                ("/rate_limit", None),
+                (f"/repos/{owner}/{repo}", None),
+                (f"/repos/{owner}/{repo}/issues", {"per_page": ISSUES_LIMIT}),
+                (f"/repos/{owner}/{repo}/events", {"per_page": EVENTS_LIMIT}),
+                (f"/repos/{owner}/{repo}/issues", {"per_page": PAGINATION_PROBE_LIMIT}),
+                ("/search/repositories", {"q": f"repo:{owner}/{repo}", "per_page": SEARCH_LIMIT}),
+                ("", None)
+            )
+            
+            # Check rate limit
+            rate_limit = self.make_request("/rate_limit")
+            if "error" not in rate_limit:
+                core = rate_limit["data"].get("resources", {}).get("core", {})
+                print(f"\n{Colors.CYAN}📊 Rate Limit:{Colors.END}")
+                print(f"   Remaining: {core.get('remaining', 'N/A')}/{core.get('limit', 'N/A')}")
+            
+            # Run all analyses
+            self.analyze_crud_pattern(owner, repo)
+            self.analyze_webhook_pattern(owner, repo)
+            self.analyze_event_driven_pattern(owner, repo)
+            self.analyze_query_pattern(owner, repo)
+            self.analyze_hateoas_pattern(owner, repo)
+        finally:
+            self._run_cache = None
         
         # Summary
         self.print_summary()
         
         return self.analysis_results
     
+    @buffered_output
     def print_summary(self):
         """In tổng kết các patterns tìm được"""
-        print(f"\n{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.HEADER}   ANALYSIS SUMMARY{Colors.END}")
-        print(f"{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.END}")
+        print_banner(Colors.HEADER, "   ANALYSIS SUMMARY")
         
         summary = f"""
 {Colors.BOLD}1. CRUD Pattern:{Colors.END}
@@ -927,12 +1202,12 @@ class GitHubAPIAnalyzer:
         print(summary)
 
 
-def print_menu():
-    """Hiển thị menu chọn pattern"""
-    print(f"\n{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.HEADER}   GITHUB API PATTERN ANALYZER - MENU{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.END}")
-    print(f"""
+# Menu (banner + các lựa chọn) dựng sẵn một lần, in bằng một lần print
+_MENU_TEXT = "\n".join((
+    "\n" + Colors.HEADER_BAR,
+    f"{Colors.BOLD}{Colors.HEADER}   GITHUB API PATTERN ANALYZER - MENU{Colors.END}",
+    Colors.HEADER_BAR,
+    f"""
 {Colors.BOLD}Chọn pattern để phân tích:{Colors.END}
 
    {Colors.BLUE}[1]{Colors.END}  CRUD Pattern        - Create, Read, Update, Delete (chỉ xem)
@@ -948,13 +1223,18 @@ def print_menu():
    {Colors.BOLD}[9]{Colors.END}  Lưu kết quả vào JSON
    {Colors.BOLD}[0]{Colors.END}  Thoát
 
-{'='*70}
-    """)
+{Colors.SEP}
+    """
+))
+
+
+def print_menu():
+    """Hiển thị menu chọn pattern"""
+    print(_MENU_TEXT)
 
 
 def main():
     """Main function với interactive menu"""
-    import sys
     import os
     
     # Get GitHub token from environment (optional)
@@ -972,9 +1252,7 @@ def main():
         owner = sys.argv[1]
         repo = sys.argv[2]
     
-    print(f"\n{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.HEADER}   GITHUB API PATTERN ANALYZER{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'='*70}{Colors.END}")
+    print_banner(Colors.HEADER, "   GITHUB API PATTERN ANALYZER")
     print(f"\n{Colors.CYAN}Repository hiện tại:{Colors.END} {Colors.GREEN}{owner}/{repo}{Colors.END}")
     
     if token:
@@ -993,9 +1271,7 @@ def main():
             analyzer.analyze_crud_pattern(owner, repo, demo_mode=False)
             
         elif choice == "1a":
-            print(f"\n{Colors.BOLD}{Colors.YELLOW}{'='*70}{Colors.END}")
-            print(f"{Colors.BOLD}{Colors.YELLOW}   🚀 CRUD DEMO MODE{Colors.END}")
-            print(f"{Colors.BOLD}{Colors.YELLOW}{'='*70}{Colors.END}")
+            print_banner(Colors.YELLOW, "   🚀 CRUD DEMO MODE")
             print(f"\n{Colors.YELLOW}⚠️  CẢNH BÁO: Chế độ này sẽ:{Colors.END}")
             print(f"   1. Tạo một issue MỚI trên repo {owner}/{repo}")
             print(f"   2. Cập nhật issue đó")
@@ -1086,13 +1362,13 @@ def main():
                 filename = input(f"   Nhập tên file (mặc định: {filename}): ").strip() or filename
                 
                 try:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(analyzer.analysis_results, f, indent=2, ensure_ascii=False, default=str)
+                    analyzer.save_results(filename)
                     print(f"\n{Colors.GREEN}✅ Đã lưu kết quả vào {filename}{Colors.END}")
                 except Exception as e:
                     print(f"{Colors.RED}Lỗi khi lưu file: {e}{Colors.END}")
                     
         elif choice == "0":
+            analyzer.close()
             print(f"\n{Colors.GREEN}Cảm ơn đã sử dụng GitHub API Pattern Analyzer!{Colors.END}")
             print(f"{Colors.CYAN}Goodbye! 👋{Colors.END}\n")
             break
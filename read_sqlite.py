@@ -15,19 +15,30 @@ if not os.path.exists(DB_PATH):
 
 conn = sqlite3.connect(DB_PATH)
 conn.row_factory = sqlite3.Row
+conn.execute("PRAGMA query_only = ON;")
 cur = conn.cursor()
 
-# Lấy danh sách bảng (loại trừ bảng nội bộ sqlite_)
-cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-tables = [r['name'] for r in cur.fetchall()]
+# Đọc toàn bộ trong một read transaction (một shared lock, snapshot nhất quán)
+cur.execute("BEGIN;")
+
+# Lấy danh sách bảng và cột của chúng trong một query (loại trừ bảng nội bộ sqlite_)
+cur.execute("""
+    SELECT m.name AS table_name, p.name AS column_name
+    FROM sqlite_master m JOIN pragma_table_info(m.name) p
+    WHERE m.type='table' AND m.name NOT LIKE 'sqlite_%'
+    ORDER BY m.rowid, p.cid;
+""")
+cols_by_table = {}
+for r in cur.fetchall():
+    cols_by_table.setdefault(r['table_name'], []).append(r['column_name'])
+tables = list(cols_by_table)
 
 print(f"Connected to: {DB_PATH}")
 print(f"Found tables: {tables}\n")
 
 for table in tables:
     print(f"--- Table: {table} ---")
-    cur.execute(f"PRAGMA table_info('{table}');")
-    cols = [r['name'] for r in cur.fetchall()]
+    cols = cols_by_table[table]
     print("Columns:", cols)
     try:
         cur.execute(f"SELECT * FROM '{table}' LIMIT 5;")
@@ -35,11 +46,12 @@ for table in tables:
         if not rows:
             print("(no rows)")
         else:
+            names = [d[0] for d in cur.description]
             for r in rows:
-                rowd = {k: r[k] for k in r.keys()}
-                print(rowd)
+                print(dict(zip(names, r)))
     except Exception as e:
         print("Failed to read rows:", e)
     print()
 
-conn.close()
\ No newline at end of file
+conn.rollback()
+conn.close()